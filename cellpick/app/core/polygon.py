@@ -94,6 +94,7 @@ class Polygon:
         self.color = QColor(255, 0, 255)
         self.original_id = original_id
         self._cached_qpolygon: Optional[QPolygonF] = None
+        self._cached_rowcol: Optional[np.ndarray] = None
         self.ar_idx = None
 
     def get_qpolygon(self) -> QPolygonF:
@@ -109,9 +110,27 @@ class Polygon:
             self._cached_qpolygon = QPolygonF(self.points)
         return self._cached_qpolygon
 
+    def get_rowcol(self) -> np.ndarray:
+        """
+        Get cached vertex coordinates as a NumPy array, creating it if necessary.
+
+        Returns
+        -------
+        np.ndarray
+            The ``(N, 2)`` float64 array of (row, col) = (y, x) vertices.
+        """
+        if self._cached_rowcol is None:
+            self._cached_rowcol = np.fromiter(
+                (v for p in self.points for v in (p.y(), p.x())),
+                dtype=np.float64,
+                count=2 * len(self.points),
+            ).reshape(-1, 2)
+        return self._cached_rowcol
+
     def invalidate_cache(self) -> None:
-        """Invalidate the cached QPolygonF (call when points change)."""
+        """Invalidate cached QPolygonF and vertex array (call when points change)."""
         self._cached_qpolygon = None
+        self._cached_rowcol = None
 
     def set_color(self) -> None:
         """
@@ -7,7 +7,7 @@ application state, including shapes, landmarks, active regions, and UI state.
 
 import random
 from enum import Enum, auto
-from typing import Any, List, Optional
+from typing import Any, List, Optional, Sequence, Union
 
 from PySide6.QtCore import QPointF, Qt
 from PySide6.QtGui import QPolygonF
@@ -588,16 +588,19 @@ class AppStateManager:
             shape.set_color()
         self.image_viewer.update_polygon_display()
 
-    def load_cell_labels(self, labels_dict: dict[int, Any]) -> None:
+    def load_cell_labels(self, labels: Union[dict[int, Any], Sequence[Any]]) -> None:
         """
         Load cell labels and generate color mapping using Tab20 or Tab10 palette.
 
         Parameters
         ----------
-        labels_dict : dict[int, Any]
+        labels : Union[dict[int, Any], Sequence[Any]]
             Dictionary mapping cell original IDs (from segmentation mask or table
-            instance column) to their labels.
+            instance column) to their labels, or a dense sequence indexed by
+            original ID with None for IDs that have no label.
         """
+        labels_dict = labels if isinstance(labels, dict) else None
+
         # If shapes have original_id attributes, build a reverse mapping
         original_id_to_index = {}
         has_original_ids = False
@@ -606,7 +609,18 @@ class AppStateManager:
                 original_id_to_index[shape.original_id] = idx
                 has_original_ids = True
 
-        if has_original_ids:
+        if has_original_ids and labels_dict is None:
+            # Look each shape's original_id up in the dense sequence
+            remapped_labels = {}
+            for original_id, shape_idx in original_id_to_index.items():
+                try:
+                    label = labels[original_id] if original_id >= 0 else None
+                except (IndexError, TypeError):
+                    continue
+                if label is not None:
+                    remapped_labels[shape_idx] = label
+            self.cell_labels = remapped_labels
+        elif has_original_ids:
             # Remap labels_dict from original_id keys to shape_index keys
             remapped_labels = {}
             for original_id, label in labels_dict.items():
@@ -614,6 +628,11 @@ class AppStateManager:
                 if shape_idx is not None:
                     remapped_labels[shape_idx] = label
             self.cell_labels = remapped_labels
+        elif labels_dict is None:
+            # No original_ids, positions in the sequence are shape indices
+            self.cell_labels = {
+                idx: label for idx, label in enumerate(labels) if label is not None
+            }
         else:
             # No original_ids, use labels_dict as-is
             self.cell_labels = labels_dict
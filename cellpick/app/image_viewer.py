@@ -1,3 +1,4 @@
+import os
 from typing import Any, List, Optional, Tuple
 
 import numpy as np
@@ -16,7 +17,7 @@ from PySide6.QtWidgets import (
 )
 
 from .components import CHANNEL_COLORS, AppState, ImageChannel, Polygon
-from .ui_components import PolygonPreviewItem
+from .ui_components import PolygonPreviewItem, use_opengl_viewport
 
 # Alpha values for shape rendering based on selection state
 ALPHA_BASE1 = 200
@@ -71,6 +72,9 @@ class ZoomableGraphicsView(QGraphicsView):
         self.zoom_factor: float = 1.0
         self.max_zoom: float = 100.0
         self.setStyleSheet("background-color: black; border: none")
+        # Opt-in GPU rendering; must precede viewport setup below
+        if os.environ.get("CELLPICK_OPENGL") == "1":
+            use_opengl_viewport(self)
         # Enable pinch gesture for trackpad zooming
         self.grabGesture(Qt.GestureType.PinchGesture)
         self.viewport().setAttribute(Qt.WidgetAttribute.WA_AcceptTouchEvents)
@@ -734,16 +738,19 @@ class ImageViewer(QWidget):
                 self.state.add_calibration_point(scene_pos)
 
     def update_lnd_preview(self, points: List[QPointF]) -> None:
-        if self.lnd_preview_item:
-            self.graphics_view.scene.removeItem(self.lnd_preview_item)
-
         pen_scale = self.get_pen_scale()
         scaled_pen_w = max(0.5, 2 * pen_scale)
         scaled_dot_size = max(1.5, 5 * pen_scale)
-        self.lnd_preview_item = PolygonPreviewItem(
-            points, color=Qt.white, pen_w=scaled_pen_w, dot_size=scaled_dot_size
-        )
-        self.graphics_view.scene.addItem(self.lnd_preview_item)
+        if self.lnd_preview_item:
+            # Reuse the item so the scene index and its cache are updated in place
+            self.lnd_preview_item.set_points(
+                points, pen_w=scaled_pen_w, dot_size=scaled_dot_size
+            )
+        else:
+            self.lnd_preview_item = PolygonPreviewItem(
+                points, color=Qt.white, pen_w=scaled_pen_w, dot_size=scaled_dot_size
+            )
+            self.graphics_view.scene.addItem(self.lnd_preview_item)
 
         self.update()
 
@@ -789,16 +796,19 @@ class ImageViewer(QWidget):
 
     # Active regions
     def update_ar_preview(self, points: List[QPointF]) -> None:
-        if self.ar_preview_item:
-            self.graphics_view.scene.removeItem(self.ar_preview_item)
-
         pen_scale = self.get_pen_scale()
         scaled_pen_w = max(0.5, 2 * pen_scale)
         scaled_dot_size = max(1.5, 5 * pen_scale)
-        self.ar_preview_item = PolygonPreviewItem(
-            points, color=Qt.yellow, pen_w=scaled_pen_w, dot_size=scaled_dot_size
-        )
-        self.graphics_view.scene.addItem(self.ar_preview_item)
+        if self.ar_preview_item:
+            # Reuse the item so the scene index and its cache are updated in place
+            self.ar_preview_item.set_points(
+                points, pen_w=scaled_pen_w, dot_size=scaled_dot_size
+            )
+        else:
+            self.ar_preview_item = PolygonPreviewItem(
+                points, color=Qt.yellow, pen_w=scaled_pen_w, dot_size=scaled_dot_size
+            )
+            self.graphics_view.scene.addItem(self.ar_preview_item)
 
         self.update()
 
@@ -5,6 +5,8 @@ This module provides classes for reading DVP XML files containing
 shape coordinates and calibration data, as well as metadata files.
 """
 
+import re
+from functools import lru_cache
 from typing import Any, List, Tuple
 
 import numpy as np
@@ -12,10 +14,34 @@ import pandas as pd
 import PIL
 from lxml import etree
 from PIL import Image
-from scipy import interpolate
 
 PIL.Image.MAX_IMAGE_PIXELS = 1063733067
 
+# Matches the per-point coordinate tags of a shape (X_1, Y_1, X_2, ...)
+_COORD_TAG_RE = re.compile(r"^([XY])_(\d+)$")
+
+
+@lru_cache(maxsize=1024)
+def _shape_xpath(index: int) -> etree.XPath:
+    """
+    Return the compiled lookup for ``Shape_<index>``.
+
+    XPath objects are document-independent, so one compilation serves every
+    file; the cache is bounded so opening many large files does not keep
+    growing it.
+
+    Parameters
+    ----------
+    index : int
+        Index of the shape (1-based).
+
+    Returns
+    -------
+    etree.XPath
+        Compiled ``//Shape_<index>`` expression.
+    """
+    return etree.XPath(f"//Shape_{index}")
+
 
 class DVPXML:
     """
@@ -29,17 +55,17 @@ class DVPXML:
         Parsed XML content.
     n_shapes : int
         Number of shapes in the XML.
-    x_calibration : List[int]
-        X calibration points.
-    y_calibration : List[int]
-        Y calibration points.
+    x_calibration : np.ndarray
+        X calibration points (int32).
+    y_calibration : np.ndarray
+        Y calibration points (int32).
     """
 
     path: str
     content: Any
     n_shapes: int
-    x_calibration: List[int]
-    y_calibration: List[int]
+    x_calibration: np.ndarray
+    y_calibration: np.ndarray
 
     def __init__(self, path: str) -> None:
         """
@@ -79,23 +105,29 @@ class DVPXML:
         if index > self.n_shapes:
             raise ValueError(f"Maximum shape is {self.n_shapes}")
 
-        shape_path = f".//Shape_{index}"
-        shape_element = self.content.find(shape_path)
+        matches = _shape_xpath(index)(self.content)
+        shape_element = matches[0] if matches else None
 
         if shape_element is not None:
             n_points = int(shape_element.find(".//PointCount").text)
             pts = np.zeros((n_points, 2))
-
-            for i in range(n_points):
-                x_path = f".//X_{i+1}"
-                y_path = f".//Y_{i+1}"
-
-                x_element = shape_element.find(x_path)
-                y_element = shape_element.find(y_path)
-
-                if x_element is not None and y_element is not None:
-                    pts[i, 0] = float(x_element.text)
-                    pts[i, 1] = float(y_element.text)
+            found = np.zeros((n_points, 2), dtype=bool)
+
+            # Classify each descendant once instead of searching the shape per
+            # point; document order keeps the first match like ``find(".//")``
+            for child in shape_element.iterdescendants(etree.Element):
+                match = _COORD_TAG_RE.match(child.tag)
+                if match is None:
+                    continue
+                i = int(match.group(2)) - 1
+                if 0 <= i < n_points:
+                    axis = 0 if match.group(1) == "X" else 1
+                    if not found[i, axis]:
+                        pts[i, axis] = float(child.text)
+                        found[i, axis] = True
+
+            # Points missing either coordinate stay at the origin
+            pts[~found.all(axis=1)] = 0.0
 
             return pts[:, 0], pts[:, 1]
         else:
@@ -103,8 +135,9 @@ class DVPXML:
 
     def read_calibration_points(self) -> None:
         """Read calibration points from the XML content."""
-        self.x_calibration = []
-        self.y_calibration = []
+        x_calibration = np.empty(3, dtype=np.int32)
+        y_calibration = np.empty(3, dtype=np.int32)
+        n_points = 0
 
         for i in range(3):
             x_path = f".//X_CalibrationPoint_{i+1}"
@@ -114,8 +147,12 @@ class DVPXML:
             y_element = self.content.find(y_path)
 
             if x_element is not None and y_element is not None:
-                self.x_calibration.append(int(x_element.text))
-                self.y_calibration.append(int(y_element.text))
+                x_calibration[n_points] = int(x_element.text)
+                y_calibration[n_points] = int(y_element.text)
+                n_points += 1
+
+        self.x_calibration = x_calibration[:n_points]
+        self.y_calibration = y_calibration[:n_points]
 
 
 class MockDVPXML:
@@ -130,9 +167,9 @@ class MockDVPXML:
         List of Polygon objects from the application state.
     n_shapes : int
         Number of shapes.
-    x_calibration : List[int]
+    x_calibration : np.ndarray
         X calibration points (default identity mapping).
-    y_calibration : List[int]
+    y_calibration : np.ndarray
         Y calibration points (default identity mapping).
     content : etree.Element
         Minimal XML content tree for compatibility.
@@ -150,8 +187,8 @@ class MockDVPXML:
         self.shapes = shapes
         self.n_shapes = len(shapes)
         # Default calibration points (identity mapping)
-        self.x_calibration = [0, 1000, 2000]
-        self.y_calibration = [0, 1000, 2000]
+        self.x_calibration = np.array([0, 1000, 2000], dtype=np.int32)
+        self.y_calibration = np.array([0, 1000, 2000], dtype=np.int32)
         # Create a minimal XML content tree for compatibility
         self.content = etree.Element("ImageData")
         gc_elem = etree.SubElement(self.content, "GlobalCoordinates")
@@ -244,9 +281,9 @@ class ImXML:
         Shape of the image.
     slide : Any
         Current slide identifier.
-    calib_x : Any
+    calib_x : np.ndarray
         X calibration values.
-    calib_y : Any
+    calib_y : np.ndarray
         Y calibration values.
     fxx : Any
         Interpolator for x calibration.
@@ -260,8 +297,8 @@ class ImXML:
     im: np.ndarray
     im_shape: Tuple[int, ...]
     slide: Any
-    calib_x: Any
-    calib_y: Any
+    calib_x: np.ndarray
+    calib_y: np.ndarray
     fxx: Any
     fyy: Any
 
@@ -287,6 +324,19 @@ class ImXML:
         self.im = np.array(Image.open(self.im_path))
         self.im_shape = self.im.shape
 
+    def load_image_shape(self) -> None:
+        """
+        Read the image shape from the file header without decoding pixels.
+
+        The resulting ``im_shape`` follows the same convention as
+        ``load_image``: ``(height, width)`` for single-band images and
+        ``(height, width, bands)`` otherwise.
+        """
+        with Image.open(self.im_path) as im:
+            width, height = im.size
+            n_bands = len(im.getbands())
+        self.im_shape = (height, width) if n_bands == 1 else (height, width, n_bands)
+
     def bounding_rect(self, x: np.ndarray, y: np.ndarray) -> List[int]:
         """
         Calculate the bounding rectangle for the given x and y coordinates.
@@ -314,16 +364,30 @@ class ImXML:
         """
         Calibrate the image using the selected slide's metadata.
 
+        Only the image shape is required; if it has not been set yet it is
+        read from the image header, so the pixel data is never decoded here.
+
         Parameters
         ----------
         slide : Any
             The slide identifier to calibrate for.
         """
+        from scipy import interpolate
+
+        if getattr(self, "im_shape", None) is None:
+            self.load_image_shape()
         self.slide = slide
         sub = self.dvpmeta.slice_subset(slide)
-        resolution = sub["resolution"].iloc[0]
-        xx = sub["X"] * 1 / resolution + self.im_shape[1] / 2
-        yy = sub["Y"] * 1 / resolution + self.im_shape[0] / 2
+        inv_resolution = 1.0 / float(sub["resolution"].iloc[0])
+        # Single multiply-add per element on contiguous buffers, no pandas temporaries
+        xx = (
+            sub["X"].to_numpy(dtype=np.float64) * inv_resolution
+            + self.im_shape[1] * 0.5
+        )
+        yy = (
+            sub["Y"].to_numpy(dtype=np.float64) * inv_resolution
+            + self.im_shape[0] * 0.5
+        )
         self.calib_x = xx
         self.calib_y = yy
         self.fxx = interpolate.interp1d(
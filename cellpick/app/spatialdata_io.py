@@ -5,22 +5,27 @@ This module provides functionality to load and export spatial omics data
 in SpatialData format (.zarr stores).
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 import warnings
 
 import numpy as np
 import pandas as pd
 from PySide6.QtCore import QPointF
 from shapely.geometry import Polygon as ShapelyPolygon
-from scipy.ndimage import find_objects
+from scipy.ndimage import center_of_mass, find_objects
+from scipy.spatial import cKDTree
 
 try:
+    import dask
+    import dask.array as da
     import spatialdata as sd
+    import zarr
     from spatialdata.models import Image2DModel, ShapesModel, TableModel
     from spatialdata.transformations import Identity
     import xarray as xr
-    from skimage import measure
     import geopandas as gpd
 
     # Silence zarr warnings about .DS_Store and other non-zarr files
@@ -40,12 +45,643 @@ try:
 except ImportError:
     SKIMAGE_AVAILABLE = False
 
+# Numba polygon rasterization (optional, cellpick[numba]; falls back to skimage.draw)
+try:
+    from numba import njit
+
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+# Label masks shorter than this many rows per worker are filled serially
+_FILL_BAND_MIN_ROWS = 256
+
+# Exported images and label masks are written as Blosc-compressed zarr chunks
+# of this (y, x) size, so writes are spread over dask workers and empty tiles
+# stay small
+_EXPORT_CHUNKS = (1024, 1024)
+
+# Images up to this size are read in one pass instead of channel by channel
+_CHANNEL_BATCH_BYTES = 4 * 1024**3
+
+# Instance IDs outside this range are treated as non-numeric
+_INT64_MIN = int(np.iinfo(np.int64).min)
+_INT64_MAX = int(np.iinfo(np.int64).max)
+
+
+if NUMBA_AVAILABLE:
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _point_in_polygon(cols, rows, s, e, x, y):
+        """
+        Crossing-number test of ``(x, y)`` against polygon ``s:e``.
+
+        Port of scikit-image's ``point_in_polygon``: returns 0 outside,
+        1 inside, 2 on a vertex and 3 on an edge.
+        """
+        eps = 1e-12
+        l_cross = 0
+        r_cross = 0
+        x1 = cols[e - 1] - x
+        y1 = rows[e - 1] - y
+        for i in range(s, e):
+            x0 = cols[i] - x
+            y0 = rows[i] - y
+            if -eps < x0 < eps and -eps < y0 < eps:
+                return 2
+            if (y0 > 0) != (y1 > 0):
+                if (x0 * y1 - x1 * y0) / (y1 - y0) > 0:
+                    r_cross += 1
+            if (y0 < 0) != (y1 < 0):
+                if (x0 * y1 - x1 * y0) / (y1 - y0) < 0:
+                    l_cross += 1
+            x1 = x0
+            y1 = y0
+        if (r_cross & 1) != (l_cross & 1):
+            return 3
+        if r_cross & 1:
+            return 1
+        return 0
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _polygon_bbox(rows, cols, s, e, height, width):
+        """
+        Pixel bounding box of polygon ``s:e``, clipped like scikit-image.
+
+        Returns ``(minr, maxr, minc, maxc)`` as inclusive bounds.
+        """
+        rmin = rows[s]
+        rmax = rows[s]
+        cmin = cols[s]
+        cmax = cols[s]
+        for i in range(s + 1, e):
+            rmin = min(rmin, rows[i])
+            rmax = max(rmax, rows[i])
+            cmin = min(cmin, cols[i])
+            cmax = max(cmax, cols[i])
+        minr = int(max(0.0, rmin))
+        maxr = min(height - 1, int(np.ceil(rmax)))
+        minc = int(max(0.0, cmin))
+        maxc = min(width - 1, int(np.ceil(cmax)))
+        return minr, maxr, minc, maxc
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _fill_polygon_rows(
+        mask, rows, cols, s, e, minr, maxr, minc, maxc, r_off, c_off, value
+    ):
+        """
+        Scanline-fill polygon ``s:e`` over rows ``minr..maxr``.
+
+        Writes ``mask[r - r_off, c - c_off] = value`` for every pixel of the
+        box that ``_point_in_polygon`` reports as inside or on the boundary.
+        Per row, the edge crossings are computed once and the pixels between
+        them are filled directly; pixels within one pixel of a crossing, and
+        rows passing through a vertex, keep the exact per-pixel test.
+        """
+        eps = 1e-12
+        xs = np.empty(e - s, dtype=np.float64)
+        for r in range(minr, maxr + 1):
+            y = float(r)
+            m = 0
+            degenerate = False
+            y1 = rows[e - 1]
+            x1 = cols[e - 1]
+            for i in range(s, e):
+                y0 = rows[i]
+                x0 = cols[i]
+                if -eps < y0 - y < eps:
+                    degenerate = True
+                    break
+                if (y0 > y) != (y1 > y):
+                    xs[m] = x1 + (y - y1) * (x0 - x1) / (y0 - y1)
+                    m += 1
+                y1 = y0
+                x1 = x0
+
+            if degenerate or m & 1:
+                for c in range(minc, maxc + 1):
+                    if _point_in_polygon(cols, rows, s, e, float(c), y):
+                        mask[r - r_off, c - c_off] = value
+                continue
+
+            crossings = np.sort(xs[:m])
+            c = minc
+            for k in range(m):
+                x = min(max(crossings[k], minc - 3.0), maxc + 3.0)
+                lo = max(minc, int(np.floor(x)) - 1)
+                hi = min(maxc, int(np.ceil(x)) + 1)
+                # Pixels strictly between crossings k - 1 and k are inside
+                if k & 1:
+                    for cc in range(c, min(lo, maxc + 1)):
+                        mask[r - r_off, cc - c_off] = value
+                for cc in range(max(c, lo), hi + 1):
+                    if _point_in_polygon(cols, rows, s, e, float(cc), y):
+                        mask[r - r_off, cc - c_off] = value
+                c = max(c, hi + 1)
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _polygon_pixels_kernel(rows, cols, offsets, height, width):
+        """
+        Flat pixel indices (``row * width + col``) covered by each polygon.
+
+        Uses the same inside test as ``_fill_polygons_kernel``. Returns the
+        concatenated indices and ``pix_offsets`` such that polygon ``k``
+        covers ``flat[pix_offsets[k]:pix_offsets[k + 1]]``.
+        """
+        n = offsets.shape[0] - 1
+        capacity = 0
+        for k in range(n):
+            if offsets[k + 1] - offsets[k] < 3:
+                continue
+            minr, maxr, minc, maxc = _polygon_bbox(
+                rows, cols, offsets[k], offsets[k + 1], height, width
+            )
+            if maxr >= minr and maxc >= minc:
+                capacity += (maxr - minr + 1) * (maxc - minc + 1)
+
+        flat = np.empty(capacity, dtype=np.int64)
+        pix_offsets = np.zeros(n + 1, dtype=np.int64)
+        m = 0
+        for k in range(n):
+            s = offsets[k]
+            e = offsets[k + 1]
+            if e - s >= 3:
+                minr, maxr, minc, maxc = _polygon_bbox(rows, cols, s, e, height, width)
+                if maxr >= minr and maxc >= minc:
+                    box = np.zeros((maxr - minr + 1, maxc - minc + 1), dtype=np.uint8)
+                    _fill_polygon_rows(
+                        box, rows, cols, s, e, minr, maxr, minc, maxc, minr, minc, 1
+                    )
+                    for r in range(minr, maxr + 1):
+                        for c in range(minc, maxc + 1):
+                            if box[r - minr, c - minc]:
+                                flat[m] = r * width + c
+                                m += 1
+            pix_offsets[k + 1] = m
+        return flat[:m], pix_offsets
+
+    @njit(cache=True, nogil=True, boundscheck=False)
+    def _fill_polygons_kernel(mask, rows, cols, offsets, values, row_start, row_stop):
+        """
+        Fill a batch of polygons into rows ``row_start:row_stop`` of a mask.
+
+        Matches ``skimage.draw.polygon``: every pixel of the (clipped)
+        bounding box whose centre is inside or on the boundary of the
+        polygon is written. Calls on disjoint row bands can run concurrently.
+
+        Parameters
+        ----------
+        mask : np.ndarray
+            2D label mask, modified in place.
+        rows, cols : np.ndarray
+            Concatenated float64 vertex coordinates of all polygons.
+        offsets : np.ndarray
+            Polygon ``k`` uses vertices ``offsets[k]:offsets[k + 1]``.
+        values : np.ndarray
+            Label value written for each polygon.
+        row_start, row_stop : int
+            Row band to fill; pixels outside it are left untouched.
+        """
+        height, width = mask.shape
+        for k in range(offsets.shape[0] - 1):
+            s = offsets[k]
+            e = offsets[k + 1]
+            if e - s < 3:
+                continue
+            minr, maxr, minc, maxc = _polygon_bbox(rows, cols, s, e, height, width)
+            minr = max(minr, row_start)
+            maxr = min(maxr, row_stop - 1)
+            _fill_polygon_rows(
+                mask, rows, cols, s, e, minr, maxr, minc, maxc, 0, 0, values[k]
+            )
+
+
+def _vertex_arrays(
+    point_lists: List[Any],
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gather polygon vertices into concatenated row/col arrays.
+
+    Parameters
+    ----------
+    point_lists : List[Any]
+        Polygon vertices, either all as lists of QPointF (x = column,
+        y = row) or all as ``(N, 2)`` (row, col) arrays such as
+        ``Polygon.get_rowcol()``.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray, np.ndarray]
+        Contiguous float64 ``rows`` and ``cols`` and int64 ``offsets``;
+        polygon ``k`` uses vertices ``offsets[k]:offsets[k + 1]``.
+    """
+    lengths = [len(points) for points in point_lists]
+    offsets = np.zeros(len(point_lists) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+
+    if point_lists and isinstance(point_lists[0], np.ndarray):
+        rowcol = np.concatenate(point_lists).reshape(-1, 2)
+    else:
+        # One pass over the QPointFs into a preallocated (N, 2) row/col array
+        rowcol = np.fromiter(
+            (v for points in point_lists for pt in points for v in (pt.y(), pt.x())),
+            dtype=np.float64,
+            count=2 * int(offsets[-1]),
+        ).reshape(-1, 2)
+    rows = np.ascontiguousarray(rowcol[:, 0])
+    cols = np.ascontiguousarray(rowcol[:, 1])
+    return rows, cols, offsets
+
+
+def _polygon_pixels(point_lists: List[Any], shape: Tuple[int, int]) -> List[np.ndarray]:
+    """
+    Return the flat pixel indices each polygon covers in a mask of ``shape``.
+
+    Coverage matches ``_fill_polygons``, so writing ``mask.reshape(-1)[idx]``
+    gives the same result as filling the polygon.
+
+    Parameters
+    ----------
+    point_lists : List[Any]
+        Polygon vertices, as accepted by ``_vertex_arrays``.
+    shape : Tuple[int, int]
+        Mask height and width.
+
+    Returns
+    -------
+    List[np.ndarray]
+        One int64 array of ``row * width + col`` indices per polygon.
+    """
+    rows, cols, offsets = _vertex_arrays(point_lists)
+    height, width = shape
+
+    if NUMBA_AVAILABLE:
+        flat, pix_offsets = _polygon_pixels_kernel(rows, cols, offsets, height, width)
+        return [
+            flat[pix_offsets[k] : pix_offsets[k + 1]] for k in range(len(point_lists))
+        ]
+
+    from skimage.draw import polygon as draw_polygon
+
+    pixels = []
+    for k in range(len(point_lists)):
+        start, end = offsets[k], offsets[k + 1]
+        if end - start < 3:
+            pixels.append(np.empty(0, dtype=np.int64))
+            continue
+        rr, cc = draw_polygon(rows[start:end], cols[start:end], shape=shape)
+        pixels.append(rr.astype(np.int64) * width + cc)
+    return pixels
+
+
+def _fill_polygons(
+    mask: np.ndarray, point_lists: List[Any], first_value: int = 1
+) -> None:
+    """
+    Fill polygons into a label mask, numbering them from ``first_value``.
+
+    Polygons with fewer than three points are skipped but still consume a
+    label value. Later polygons overwrite earlier ones where they overlap.
+    With Numba the mask is split into row bands filled on worker threads;
+    without it, polygons are rasterized on worker threads and written in
+    order on the calling thread.
+
+    Parameters
+    ----------
+    mask : np.ndarray
+        2D label mask, modified in place.
+    point_lists : List[Any]
+        Polygon vertices, as accepted by ``_vertex_arrays``.
+    first_value : int
+        Label value of the first polygon.
+    """
+    rows, cols, offsets = _vertex_arrays(point_lists)
+    n_workers = os.cpu_count() or 1
+
+    if NUMBA_AVAILABLE:
+        values = np.arange(
+            first_value, first_value + len(point_lists), dtype=mask.dtype
+        )
+        n_bands = min(n_workers, mask.shape[0] // _FILL_BAND_MIN_ROWS)
+        if n_bands <= 1:
+            _fill_polygons_kernel(mask, rows, cols, offsets, values, 0, mask.shape[0])
+            return
+        bounds = np.linspace(0, mask.shape[0], n_bands + 1).astype(np.int64)
+        with ThreadPoolExecutor(max_workers=n_bands) as executor:
+            futures = [
+                executor.submit(
+                    _fill_polygons_kernel,
+                    mask,
+                    rows,
+                    cols,
+                    offsets,
+                    values,
+                    bounds[b],
+                    bounds[b + 1],
+                )
+                for b in range(n_bands)
+            ]
+            for future in futures:
+                future.result()
+        return
+
+    from skimage.draw import polygon as draw_polygon
+
+    def rasterize(k):
+        start, end = offsets[k], offsets[k + 1]
+        if end - start < 3:
+            return None
+        try:
+            return draw_polygon(rows[start:end], cols[start:end], shape=mask.shape)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        # map() yields in submission order, so overlaps resolve as before
+        for k, result in enumerate(executor.map(rasterize, range(len(point_lists)))):
+            if result is None:
+                continue
+            if isinstance(result, Exception):
+                print(
+                    f"[Export]   Warning: Failed to draw polygon {first_value + k}: {result}"
+                )
+                continue
+            rr, cc = result
+            mask[rr, cc] = first_value + k
+
+
+def _fill_shared_polygons(
+    mask: np.ndarray,
+    polygons: List,
+    first_value: int,
+    raster_cache: Dict[int, np.ndarray],
+    shared_ids: set,
+) -> None:
+    """
+    Fill polygons like ``_fill_polygons``, reusing cached coverage.
+
+    Polygons whose ``id()`` is in ``shared_ids`` are rasterized once into
+    ``raster_cache`` and written from there, so a polygon that appears in
+    several exported masks is only rasterized for the first of them. Runs of
+    other polygons go through ``_fill_polygons``; writes stay in list order.
+
+    Parameters
+    ----------
+    mask : np.ndarray
+        C-contiguous 2D label mask, modified in place.
+    polygons : List
+        Polygon objects; vertices come from their cached ``get_rowcol()``.
+    first_value : int
+        Label value of the first polygon.
+    raster_cache : Dict[int, np.ndarray]
+        Flat pixel indices keyed by polygon ``id()``; filled as needed.
+    shared_ids : set
+        ``id()`` of the polygons worth caching.
+    """
+    missing = [
+        poly
+        for poly in polygons
+        if id(poly) in shared_ids and id(poly) not in raster_cache
+    ]
+    if missing:
+        pixels = _polygon_pixels([poly.get_rowcol() for poly in missing], mask.shape)
+        for poly, flat in zip(missing, pixels):
+            raster_cache[id(poly)] = flat
+
+    flat_mask = mask.reshape(-1)
+    run_start = 0
+    for k, poly in enumerate(polygons):
+        flat = raster_cache.get(id(poly)) if id(poly) in shared_ids else None
+        if flat is None:
+            continue
+        if run_start < k:
+            _fill_polygons(
+                mask,
+                [p.get_rowcol() for p in polygons[run_start:k]],
+                first_value + run_start,
+            )
+        flat_mask[flat] = first_value + k
+        run_start = k + 1
+    if run_start < len(polygons):
+        _fill_polygons(
+            mask,
+            [p.get_rowcol() for p in polygons[run_start:]],
+            first_value + run_start,
+        )
+
+
+def _label_mask_dtype(n_labels: int) -> type:
+    """
+    Return the narrowest unsigned dtype that holds labels ``1..n_labels``.
+
+    Parameters
+    ----------
+    n_labels : int
+        Number of labels written into the mask.
+
+    Returns
+    -------
+    type
+        ``np.uint16`` when the labels fit, otherwise ``np.uint32``.
+    """
+    return np.uint16 if n_labels <= np.iinfo(np.uint16).max else np.uint32
+
+
+def _mask_contour(mask: np.ndarray, tolerance: float) -> Optional[np.ndarray]:
+    """
+    Return the simplified longest contour of a binary mask.
+
+    Uses scikit-image's ``find_contours``/``approximate_polygon``.
+
+    Parameters
+    ----------
+    mask : np.ndarray
+        2D uint8 mask (1 inside the region).
+    tolerance : float
+        Simplification tolerance in pixels.
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        ``(N, 2)`` array of (row, col) vertices in mask coordinates, or None
+        if the mask has no contour.
+    """
+    contours = skimage_measure.find_contours(mask, 0.5)
+    if not contours:
+        return None
+    # Use the longest contour (outer boundary); most masks have just one
+    contour = contours[0] if len(contours) == 1 else max(contours, key=len)
+    if len(contour) < 3:
+        return contour
+    return skimage_measure.approximate_polygon(contour, tolerance=tolerance)
+
+
+def _label_contour(
+    label_array_int: np.ndarray,
+    label_id: int,
+    bbox: Tuple[slice, slice],
+    padding: int = 25,
+) -> Optional[np.ndarray]:
+    """
+    Return the simplified outer contour of one label.
+
+    Runs ``_mask_contour`` on a padded window around the bounding box.
+
+    Parameters
+    ----------
+    label_array_int : np.ndarray
+        2D integer label array.
+    label_id : int
+        Label ID to extract.
+    bbox : Tuple[slice, slice]
+        Bounding box of the label as returned by ``find_objects``.
+    padding : int
+        Pixel padding around the bounding box.
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        ``(N, 2)`` array of (row, col) vertices in image coordinates, or None
+        if the contour has fewer than three vertices.
+    """
+    img_height, img_width = label_array_int.shape
+    row_min = max(0, bbox[0].start - padding)
+    row_max = min(img_height, bbox[0].stop + padding)
+    col_min = max(0, bbox[1].start - padding)
+    col_max = min(img_width, bbox[1].stop + padding)
+
+    # Create binary mask for this specific label in the padded region
+    region = label_array_int[row_min:row_max, col_min:col_max]
+    mask_bbox = (region == label_id).astype(np.uint8)
+
+    coords = _mask_contour(mask_bbox, tolerance=1.0)
+    if coords is None or len(coords) < 3:
+        return None
+
+    # coords are (row, col) in bbox space, shift back to image space
+    return coords + np.array([row_min, col_min])
+
+
+def _rowcol_to_qpoints(
+    coords: np.ndarray, row_offset: float = 0.0, col_offset: float = 0.0
+) -> List[QPointF]:
+    """
+    Convert (row, col) vertices to QPointF (x = col, y = row).
+
+    The offset is applied in NumPy and the array is turned into Python floats
+    with a single ``tolist()`` call, so no per-vertex NumPy scalar indexing or
+    ``float()`` calls are needed.
+
+    Parameters
+    ----------
+    coords : np.ndarray
+        ``(N, 2)`` array of (row, col) vertices.
+    row_offset, col_offset : float
+        Offset added to every vertex.
+
+    Returns
+    -------
+    List[QPointF]
+        The vertices as QPointF.
+    """
+    rc = np.asarray(coords, dtype=np.float64)
+    if row_offset or col_offset:
+        rc = rc + (row_offset, col_offset)
+    return [QPointF(col, row) for row, col in rc.tolist()]
+
+
+def _label_areas(label_array_int: np.ndarray, n_labels: int) -> np.ndarray:
+    """
+    Count the pixels of every label in a single pass.
+
+    The mask is histogrammed in row blocks so the temporary ``intp`` copy
+    made by ``np.bincount`` stays bounded for gigapixel masks.
+
+    Parameters
+    ----------
+    label_array_int : np.ndarray
+        2D integer label array.
+    n_labels : int
+        Largest label ID (``len(find_objects(...))``).
+
+    Returns
+    -------
+    np.ndarray
+        Array of length ``n_labels + 1`` where entry ``i`` is the area of
+        label ``i`` (negative IDs are counted as background).
+    """
+    counts = np.zeros(n_labels + 1, dtype=np.int64)
+    block_rows = max(1, (1 << 24) // max(1, label_array_int.shape[1]))
+    for start in range(0, label_array_int.shape[0], block_rows):
+        block = label_array_int[start : start + block_rows].ravel()
+        try:
+            block_counts = np.bincount(block, minlength=n_labels + 1)
+        except ValueError:
+            block_counts = np.bincount(np.maximum(block, 0), minlength=n_labels + 1)
+        counts += block_counts[: n_labels + 1]
+    return counts
+
+
+def _nonzero_ids(block: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Return the non-zero label IDs in a block of a label array and their sizes.
+
+    Parameters
+    ----------
+    block : np.ndarray
+        Label array block.
+
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        Sorted unique IDs greater than zero and their pixel counts.
+    """
+    ids, counts = np.unique(block, return_counts=True)
+    keep = ids > 0
+    return ids[keep], counts[keep]
+
+
+def _contours_for_labels(
+    label_array_int: np.ndarray,
+    slices: List[Optional[Tuple[slice, slice]]],
+    label_ids: List[int],
+) -> List[Tuple[np.ndarray, int]]:
+    """
+    Extract contours for a batch of label IDs.
+
+    Parameters
+    ----------
+    label_array_int : np.ndarray
+        2D integer label array.
+    slices : List[Optional[Tuple[slice, slice]]]
+        Bounding boxes from ``find_objects`` (index ``i`` is label ``i + 1``).
+    label_ids : List[int]
+        Label IDs to process.
+
+    Returns
+    -------
+    List[Tuple[np.ndarray, int]]
+        ``(coords, label_id)`` pairs in input order, with ``coords`` as
+        ``(N, 2)`` (row, col) arrays in image coordinates.
+    """
+    results = []
+    for label_id in label_ids:
+        bbox = slices[label_id - 1]  # slices[0] is for label 1
+        if bbox is None:
+            continue
+        coords = _label_contour(label_array_int, label_id, bbox)
+        if coords is not None:
+            results.append((coords, label_id))
+    return results
+
 
 def extract_polygons_from_label_image(
     label_array: np.ndarray,
     min_area: int = 10,
     max_cells: int = 100000,
     progress_callback: Optional[callable] = None,
+    return_centroids: bool = False,
 ) -> List[Tuple[List[QPointF], str, int]]:
     """
     Extract polygons from a segmentation label image.
@@ -63,11 +699,16 @@ def extract_polygons_from_label_image(
         Maximum number of cells to extract (to prevent hanging on huge datasets).
     progress_callback : Optional[callable]
         Callback function(current, total) to report progress.
+    return_centroids : bool
+        If True, also return the vertex centroids of the polygons.
 
     Returns
     -------
     List[Tuple[List[QPointF], str, int]]
-        List of (polygon_points, label, original_mask_id) tuples.
+        List of (polygon_points, label, original_mask_id) tuples. If
+        ``return_centroids`` is True, a ``(polygons, centroids)`` pair is
+        returned instead, where ``centroids`` is an ``(M, 2)`` float32 array
+        of (x, y) vertex means aligned with ``polygons``.
 
     Raises
     ------
@@ -86,26 +727,39 @@ def extract_polygons_from_label_image(
         raise ValueError(f"Expected 2D label array, got shape {label_array.shape}")
 
     polygons = []
+    centroids = []
 
-    # Convert to integer array for find_objects
-    try:
-        label_array_int = label_array.astype(np.int32)
-    except Exception:
-        # Fallback: convert to numeric first
-        flat = label_array.ravel()
-        numeric = pd.to_numeric(flat, errors="coerce")
-        label_array_int = numeric.values.reshape(label_array.shape)
-        label_array_int = np.nan_to_num(label_array_int, 0).astype(np.int32)
+    # find_objects accepts any integer dtype, so integer masks are used as-is
+    # (no H x W copy); everything else is converted to int32
+    if np.issubdtype(label_array.dtype, np.integer):
+        label_array_int = np.ascontiguousarray(label_array)
+    else:
+        try:
+            label_array_int = label_array.astype(np.int32)
+        except Exception:
+            # Fallback: convert to numeric first
+            flat = label_array.ravel()
+            numeric = pd.to_numeric(flat, errors="coerce")
+            label_array_int = numeric.values.reshape(label_array.shape)
+            label_array_int = np.nan_to_num(label_array_int, 0).astype(np.int32)
 
     # FAST: Pre-compute bounding boxes for ALL labels at once
     # slices[i] contains the bounding box for label (i+1)
     slices = find_objects(label_array_int)
 
     if not slices:
-        return []
+        return (polygons, np.empty((0, 2), np.float32)) if return_centroids else []
+
+    # One streaming pass gives every label's area, so labels below min_area
+    # are dropped before their bounding boxes are ever touched
+    counts = _label_areas(label_array_int, len(slices))
 
-    # Get valid label IDs that have bounding boxes
-    valid_labels = [i + 1 for i, s in enumerate(slices) if s is not None]
+    # Get valid label IDs that have bounding boxes and enough pixels
+    valid_labels = [
+        i + 1
+        for i, s in enumerate(slices)
+        if s is not None and counts[i + 1] >= min_area
+    ]
 
     # Limit number of cells
     total_cells = len(valid_labels)
@@ -113,64 +767,184 @@ def extract_polygons_from_label_image(
         print(f"Warning: Found {total_cells} cells, limiting to {max_cells}")
         valid_labels = valid_labels[:max_cells]
 
-    # Get image dimensions
-    img_height, img_width = label_array_int.shape
-    padding = 25  # Pixel padding around bounding box
+    # Process labels in chunks so progress is reported per chunk
+    n_labels = len(valid_labels)
+    chunk_size = 100
+    for start in range(0, n_labels, chunk_size):
+        if progress_callback:
+            progress_callback(start, n_labels)
 
-    # Iterate over valid label ids
-    for idx, label_id in enumerate(valid_labels):
-        # Report progress
-        if progress_callback and idx % 100 == 0:
-            progress_callback(idx, len(valid_labels))
+        chunk = valid_labels[start : start + chunk_size]
+        for coords, label_id in _contours_for_labels(label_array_int, slices, chunk):
+            centroids.append(coords.mean(axis=0)[::-1])
+            points = _rowcol_to_qpoints(coords)
+            # Store both the label string and the original mask ID
+            polygons.append((points, f"Cell_{int(label_id)}", int(label_id)))
 
-        # 1) Get pre-computed bounding box (instant lookup!)
-        bbox = slices[label_id - 1]  # slices[0] is for label 1
+    if return_centroids:
+        return polygons, np.asarray(centroids, dtype=np.float32).reshape(-1, 2)
+    return polygons
 
-        if bbox is None:
-            continue
 
-        # 2) Add padding to bounding box
-        row_min = max(0, bbox[0].start - padding)
-        row_max = min(img_height, bbox[0].stop + padding)
-        col_min = max(0, bbox[1].start - padding)
-        col_max = min(img_width, bbox[1].stop + padding)
+def _coerce_int_ids(
+    values: pd.Series, decimal_strings: bool = False
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Convert instance IDs to integers where they are integral.
 
-        # Extract the bounding box region from the label array
-        region = label_array_int[row_min:row_max, col_min:col_max]
+    Integers, integral floats and strings of digits (surrounding whitespace
+    allowed) that fit in int64 are converted; everything else is flagged as
+    non-numeric. Integers and digit strings are converted exactly, so IDs
+    above 2**53 are not rounded.
 
-        # Create binary mask for this specific label in the region
-        mask_bbox = (region == label_id).astype(np.uint8)
+    Parameters
+    ----------
+    values : pd.Series
+        Instance ID column.
+    decimal_strings : bool
+        Also accept unsigned decimal strings with an integral value
+        (e.g. ``"3.0"``).
 
-        # Check if cell has enough pixels
-        if np.sum(mask_bbox) < min_area:
-            continue
+    Returns
+    -------
+    Tuple[np.ndarray, np.ndarray]
+        ``(ids, valid)``: int64 IDs (0 where invalid) and a boolean mask of
+        the entries that could be converted.
+    """
+    values = values.reset_index(drop=True)
+    if isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(object)
+    ids = np.zeros(len(values), dtype=np.int64)
+    valid = np.zeros(len(values), dtype=bool)
+
+    if pd.api.types.is_bool_dtype(values) or pd.api.types.is_integer_dtype(values):
+        valid = values.notna().to_numpy()
+        if pd.api.types.is_unsigned_integer_dtype(values):
+            valid = valid & (values <= _INT64_MAX).to_numpy(dtype=bool, na_value=False)
+        ids[valid] = values[valid].to_numpy(dtype=np.int64)
+        return ids, valid
+
+    def _set_exact(positions: np.ndarray, subset: pd.Series) -> None:
+        # int() keeps every digit; a float64 round trip would not
+        as_int = [int(v) for v in subset]
+        fits = np.fromiter(
+            (_INT64_MIN <= v <= _INT64_MAX for v in as_int),
+            dtype=bool,
+            count=len(as_int),
+        )
+        ids[positions[fits]] = [v for v, ok in zip(as_int, fits) if ok]
+        valid[positions[fits]] = True
+
+    def _set_float(positions: np.ndarray, numeric: np.ndarray) -> None:
+        numeric = np.asarray(numeric, dtype=np.float64)
+        ok = (
+            np.isfinite(numeric)
+            & (np.floor(numeric) == numeric)
+            & (np.abs(numeric) < 2.0**63)
+        )
+        ids[positions[ok]] = numeric[ok].astype(np.int64)
+        valid[positions[ok]] = True
+
+    def _matches(matched: pd.Series) -> np.ndarray:
+        return matched.astype("boolean").fillna(False).to_numpy(bool)
+
+    positions = np.arange(len(values))
+    if pd.api.types.is_float_dtype(values):
+        _set_float(positions, values.to_numpy(dtype=np.float64, na_value=np.nan))
+        return ids, valid
+
+    inferred = pd.api.types.infer_dtype(values, skipna=True)
+    no_rows = np.zeros(len(values), dtype=bool)
+    if inferred in ("string", "empty"):
+        is_str, is_int = values.notna().to_numpy(), no_rows
+    elif inferred in ("integer", "boolean"):
+        is_str, is_int = no_rows, values.notna().to_numpy()
+    elif inferred == "floating":
+        is_str, is_int = no_rows, no_rows
+    else:
+        # Mixed types: strings, integers and floats are converted separately
+        is_str = values.map(type).eq(str).to_numpy()
+        is_int = values.map(lambda v: isinstance(v, (int, np.integer))).to_numpy()
+
+    if is_str.any():
+        stripped = values[is_str].str.strip()
+        # isdecimal() accepts exactly the digits int() parses
+        digits = _matches(stripped.str.isdecimal())
+        _set_exact(positions[is_str][digits], stripped[digits])
+        if decimal_strings:
+            # One matching pass; no per-row copy with the decimal point removed
+            decimal = _matches(stripped.str.fullmatch(r"\d+\.?\d*|\.\d+")) & ~digits
+            _set_float(
+                positions[is_str][decimal],
+                pd.to_numeric(stripped[decimal], errors="coerce").to_numpy(
+                    dtype=np.float64, na_value=np.nan
+                ),
+            )
+    if is_int.any():
+        _set_exact(positions[is_int], values[is_int])
+    rest = ~(is_str | is_int)
+    if rest.any():
+        _set_float(
+            positions[rest],
+            pd.to_numeric(values[rest], errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan
+            ),
+        )
+    return ids, valid
 
-        # 3) Find contours in the bounding box
-        contours = skimage_measure.find_contours(mask_bbox, 0.5)
 
-        if not contours:
-            continue
+def _normalize_labels(values: pd.Series) -> pd.Series:
+    """
+    Replace missing labels with ``""`` and strip whitespace from strings.
 
-        # Use the longest contour (outer boundary)
-        contour = max(contours, key=len)
+    Parameters
+    ----------
+    values : pd.Series
+        Label column.
 
-        # Check minimum points
-        if len(contour) < 3:
-            continue
+    Returns
+    -------
+    pd.Series
+        Object series of normalized labels.
+    """
+    values = values.astype(object)
+    missing = values.isna()
+    try:
+        stripped = values.str.strip()
+        values = stripped.where(stripped.notna(), values)
+    except AttributeError:
+        pass
+    return values.where(~missing, "")
 
-        # Approximate polygon to reduce points
-        coords = skimage_measure.approximate_polygon(contour, tolerance=1.0)
 
-        # Convert to QPointF and offset by bounding box origin to map to original image
-        if len(coords) >= 3:
-            # coords are (row, col) in bbox space, need to add bbox origin offsets
-            points = [
-                QPointF(float(x[1] + col_min), float(x[0] + row_min)) for x in coords
-            ]
-            # Store both the label string and the original mask ID
-            polygons.append((points, f"Cell_{int(label_id)}", int(label_id)))
+def _dense_labels(keys: np.ndarray, label_values: pd.Series) -> Optional[np.ndarray]:
+    """
+    Scatter labels into an object array indexed by cell ID.
 
-    return polygons
+    Parameters
+    ----------
+    keys : np.ndarray
+        int64 cell ID of every row.
+    label_values : pd.Series
+        Label of every row.
+
+    Returns
+    -------
+    Optional[np.ndarray]
+        Object array of length ``max_id + 1`` (``None`` for missing IDs), or
+        None if an ID is negative or the IDs are too sparse
+        (``max_id >= 10 * n_cells``). Duplicate IDs keep their last row.
+    """
+    if len(keys) == 0:
+        return np.empty(0, dtype=object)
+    # Keep the last row of every ID, as a dict built from the rows does
+    unique_ids, last_from_end = np.unique(keys[::-1], return_index=True)
+    rows = len(keys) - 1 - last_from_end
+    if unique_ids[0] < 0 or unique_ids[-1] >= 10 * len(unique_ids):
+        return None
+    labels = np.full(int(unique_ids[-1]) + 1, None, dtype=object)
+    labels[unique_ids] = label_values.to_numpy(dtype=object)[rows]
+    return labels
 
 
 class SpatialDataLoader:
@@ -183,16 +957,24 @@ class SpatialDataLoader:
         The loaded SpatialData object.
     path : Path
         Path to the .zarr store.
+    cell_centroids : Optional[np.ndarray]
+        (x, y) vertex centroids of the polygons last extracted from labels.
     """
 
-    def __init__(self, path: str) -> None:
+    def __init__(self, path: str, selection: Optional[Tuple[str, ...]] = None) -> None:
         """
         Initialize the SpatialData loader.
 
+        The store is not read until an element is first accessed; listing
+        element names only reads the zarr group metadata.
+
         Parameters
         ----------
         path : str
             Path to the .zarr store.
+        selection : Optional[Tuple[str, ...]]
+            Element types to read (e.g. ``("images", "labels")``), forwarded
+            to ``sd.read_zarr``. If None, all element types are read.
 
         Raises
         ------
@@ -207,11 +989,102 @@ class SpatialDataLoader:
                 "Please install it with: pip install spatialdata spatialdata-io spatialdata-plot"
             )
 
+        self.cell_centroids: Optional[np.ndarray] = None
+        self._pyramid_cache: Dict[Tuple[str, str, int], Any] = {}
+        self._selection = selection
+        self._sdata = None
+        self._root = None
         self.path = Path(path)
         if not self.path.exists():
             raise FileNotFoundError(f"SpatialData store not found: {path}")
+        self._store = str(path)
+
+    @property
+    def sdata(self) -> "sd.SpatialData":
+        """The SpatialData object, read from the store on first access."""
+        if self._sdata is None:
+            self._sdata = sd.read_zarr(self._store, selection=self._selection)
+        return self._sdata
+
+    @sdata.setter
+    def sdata(self, value: "sd.SpatialData") -> None:
+        self._sdata = value
+        self._pyramid_cache.clear()
+
+    def _open_root(self) -> "zarr.Group":
+        """
+        Open the root zarr group, via consolidated metadata when present.
+
+        Returns
+        -------
+        zarr.Group
+            Read-only root group of the store.
+        """
+        try:
+            return zarr.open_consolidated(
+                self._store, mode="r", metadata_key="zmetadata"
+            )
+        except KeyError:
+            return zarr.open_group(self._store, mode="r")
+
+    def _element_names(self, elem_kind: str) -> List[str]:
+        """
+        List the elements of one type without reading the SpatialData object.
 
-        self.sdata = sd.read_zarr(path)
+        Element types outside the loader's selection are always empty. Falls
+        back to the loaded object once it exists, or if the zarr group cannot
+        be listed directly.
+
+        Parameters
+        ----------
+        elem_kind : str
+            ``"images"``, ``"labels"``, ``"shapes"`` or ``"tables"``.
+
+        Returns
+        -------
+        List[str]
+            Element names.
+        """
+        if self._selection is not None and elem_kind not in self._selection:
+            return []
+        if self._sdata is None:
+            try:
+                if self._root is None:
+                    self._root = self._open_root()
+                if elem_kind in self._root:
+                    return list(self._root[elem_kind].group_keys())
+                # Legacy stores keep a single table under "table"
+                if not (elem_kind == "tables" and "table" in self._root):
+                    return []
+            except Exception:
+                pass
+        if hasattr(self.sdata, elem_kind):
+            return list(getattr(self.sdata, elem_kind).keys())
+        return []
+
+    def _get_level(self, elem_kind: str, name: str, n: int) -> Any:
+        """
+        Return pyramid level ``n`` of a multiscale element, memoized.
+
+        Parameters
+        ----------
+        elem_kind : str
+            ``"images"`` or ``"labels"``.
+        name : str
+            Name of the element.
+        n : int
+            Scale level (0 = highest resolution).
+
+        Returns
+        -------
+        Any
+            The (lazy) DataArray of that level.
+        """
+        key = (elem_kind, name, n)
+        if key not in self._pyramid_cache:
+            element = getattr(self.sdata, elem_kind)[name]
+            self._pyramid_cache[key] = sd.get_pyramid_levels(element, n=n)
+        return self._pyramid_cache[key]
 
     def get_available_images(self) -> List[str]:
         """
@@ -222,9 +1095,7 @@ class SpatialDataLoader:
         List[str]
             Names of available images.
         """
-        if hasattr(self.sdata, "images"):
-            return list(self.sdata.images.keys())
-        return []
+        return self._element_names("images")
 
     def get_available_labels(self) -> List[str]:
         """
@@ -235,9 +1106,7 @@ class SpatialDataLoader:
         List[str]
             Names of available labels.
         """
-        if hasattr(self.sdata, "labels"):
-            return list(self.sdata.labels.keys())
-        return []
+        return self._element_names("labels")
 
     def get_available_shapes(self) -> List[str]:
         """
@@ -248,9 +1117,7 @@ class SpatialDataLoader:
         List[str]
             Names of available shapes.
         """
-        if hasattr(self.sdata, "shapes"):
-            return list(self.sdata.shapes.keys())
-        return []
+        return self._element_names("shapes")
 
     def get_available_tables(self) -> List[str]:
         """
@@ -261,9 +1128,7 @@ class SpatialDataLoader:
         List[str]
             Names of available tables.
         """
-        if hasattr(self.sdata, "tables"):
-            return list(self.sdata.tables.keys())
-        return []
+        return self._element_names("tables")
 
     def get_available_scale_levels(self, image_name: Optional[str] = None) -> List[str]:
         """
@@ -358,7 +1223,7 @@ class SpatialDataLoader:
             try:
                 # Get the data for this level
                 if hasattr(image, "children") and image.children:
-                    level_data = sd.get_pyramid_levels(image, n=i)
+                    level_data = self._get_level("images", image_name, i)
                 else:
                     level_data = image
 
@@ -454,22 +1319,21 @@ class SpatialDataLoader:
 
         # Check obs (observations/cells metadata) for categorical columns
         if hasattr(table, "obs"):
-            for col in table.obs.columns:
+            for col, dtype in table.obs.dtypes.items():
                 if col.startswith("_"):
                     continue
 
-                # Check if column is categorical
-                col_data = table.obs[col]
-
                 # Pandas categorical dtype
-                if pd.api.types.is_categorical_dtype(col_data):
+                if isinstance(dtype, pd.CategoricalDtype):
                     categorical_cols.append(col)
                 # String/object dtype with limited unique values (likely categorical)
                 elif pd.api.types.is_object_dtype(
-                    col_data
-                ) or pd.api.types.is_string_dtype(col_data):
-                    n_unique = col_data.nunique()
-                    n_total = len(col_data)
+                    dtype
+                ) or pd.api.types.is_string_dtype(dtype):
+                    # factorize hashes the column once (NaN is not counted)
+                    _, uniques = pd.factorize(table.obs[col], sort=False)
+                    n_unique = len(uniques)
+                    n_total = len(table.obs)
                     # If less than 20% unique values and less than 100 unique values, treat as categorical
                     if n_unique < min(100, n_total * 0.2) and n_unique > 1:
                         categorical_cols.append(col)
@@ -498,6 +1362,108 @@ class SpatialDataLoader:
             Dictionary mapping cell indices (0-based) to their labels, or None if not found.
             The indices correspond to the order of cells as loaded into CellPick.
         """
+        keyed = self._cell_label_keys(label_column, table_name, instance_column)
+        if keyed is None:
+            return None
+        keys, label_values = keyed
+        return dict(zip(keys.tolist(), label_values.tolist()))
+
+    def get_cell_labels_array(
+        self,
+        label_column: str,
+        table_name: Optional[str] = None,
+        instance_column: Optional[str] = None,
+    ) -> Optional[np.ndarray]:
+        """
+        Get labels for each cell as a dense array indexed by cell ID.
+
+        Same lookup as ``get_cell_labels``, but the labels are scattered into
+        an object array of length ``max_id + 1`` (``None`` for missing IDs),
+        which is far smaller than a dict for large tables. Duplicate IDs keep
+        the label of their last row.
+
+        Parameters
+        ----------
+        label_column : str
+            Name of the column containing labels.
+        table_name : Optional[str]
+            Name of the table to get labels from. If None, uses the first available table.
+        instance_column : Optional[str]
+            Column holding the cell IDs. If None, it is detected automatically.
+
+        Returns
+        -------
+        Optional[np.ndarray]
+            Object array of labels, or None if the column is not found or the
+            IDs are too sparse (``max_id >= 10 * n_cells``) for a dense array;
+            use ``get_cell_labels`` in that case.
+        """
+        keyed = self._cell_label_keys(label_column, table_name, instance_column)
+        if keyed is None:
+            return None
+        return _dense_labels(*keyed)
+
+    def get_cell_label_mapping(
+        self,
+        label_column: str,
+        table_name: Optional[str] = None,
+        instance_column: Optional[str] = None,
+    ) -> Optional[Union[np.ndarray, Dict[int, Any]]]:
+        """
+        Get labels for each cell, as a dense array when the IDs allow it.
+
+        Resolves the table column once and returns what
+        ``get_cell_labels_array`` would, or the dict of ``get_cell_labels``
+        when the IDs are too sparse for a dense array.
+
+        Parameters
+        ----------
+        label_column : str
+            Name of the column containing labels.
+        table_name : Optional[str]
+            Name of the table to get labels from. If None, uses the first available table.
+        instance_column : Optional[str]
+            Column holding the cell IDs. If None, it is detected automatically.
+
+        Returns
+        -------
+        Optional[Union[np.ndarray, Dict[int, Any]]]
+            Object array of labels indexed by cell ID, dictionary mapping cell
+            IDs to labels, or None if the table or column is not found.
+        """
+        keyed = self._cell_label_keys(label_column, table_name, instance_column)
+        if keyed is None:
+            return None
+        labels = _dense_labels(*keyed)
+        if labels is None:
+            keys, label_values = keyed
+            return dict(zip(keys.tolist(), label_values.tolist()))
+        return labels
+
+    def _cell_label_keys(
+        self,
+        label_column: str,
+        table_name: Optional[str],
+        instance_column: Optional[str],
+    ) -> Optional[Tuple[np.ndarray, pd.Series]]:
+        """
+        Resolve the cell IDs and normalized labels of a table column.
+
+        Parameters
+        ----------
+        label_column : str
+            Name of the column containing labels.
+        table_name : Optional[str]
+            Name of the table. If None, uses the first available table.
+        instance_column : Optional[str]
+            Column holding the cell IDs. If None, it is detected automatically.
+
+        Returns
+        -------
+        Optional[Tuple[np.ndarray, pd.Series]]
+            int64 cell IDs (row index for non-numeric IDs) and the labels in
+            table row order, or None if the table or column is not found.
+        """
         tables = self.get_available_tables()
         if not tables:
             return None
@@ -512,8 +1478,6 @@ class SpatialDataLoader:
 
         # Check in obs (observations/cells metadata)
         if hasattr(table, "obs") and label_column in table.obs.columns:
-            labels_dict = {}
-
             # Determine which column contains instance IDs. Preference order:
             # 1) caller-provided instance_column
             # 2) spatialdata_attrs.instance_key
@@ -544,55 +1508,19 @@ class SpatialDataLoader:
                 instance_key = "index"
 
             # Gather instance values and labels
-            if instance_key == "index":
-                instances = table.obs.index.tolist()
+            if instance_key == "index" or instance_key not in table.obs.columns:
+                instances = table.obs.index.to_series()
             else:
-                instances = (
-                    table.obs[instance_key].tolist()
-                    if instance_key in table.obs.columns
-                    else table.obs.index.tolist()
-                )
-
-            label_values = table.obs[label_column].tolist()
-
-            # Helper to coerce values to int when possible
-            def _coerce_int(v):
-                try:
-                    if isinstance(v, (int, np.integer)):
-                        return int(v)
-                    if isinstance(v, float) and v.is_integer():
-                        return int(v)
-                    if isinstance(v, str) and v.strip().isdigit():
-                        return int(v.strip())
-                except Exception:
-                    pass
-                return None
+                instances = table.obs[instance_key]
 
-            coerced = [_coerce_int(x) for x in instances]
-            numeric_ids = [c for c in coerced if c is not None]
+            ids, is_numeric = _coerce_int_ids(instances)
+            label_values = _normalize_labels(table.obs[label_column])
 
             # Map instance IDs directly to labels WITHOUT modification
-            # The original_id in Polygon objects should match these raw instance IDs
-            for idx, (inst, lbl) in enumerate(zip(instances, label_values)):
-                # Normalize label values
-                try:
-                    if pd.isna(lbl):
-                        lbl = ""
-                    elif isinstance(lbl, str):
-                        lbl = lbl.strip()
-                except Exception:
-                    pass
-
-                cid = _coerce_int(inst)
-                if cid is not None:
-                    # Use the ORIGINAL instance ID as the key (no 0/1-based conversion)
-                    # This must match Polygon.original_id which comes from the segmentation mask
-                    labels_dict[int(cid)] = lbl
-                else:
-                    # Non-numeric ID: use row index as fallback
-                    labels_dict[idx] = lbl
-
-            return labels_dict
+            # The original_id in Polygon objects should match these raw instance IDs;
+            # non-numeric IDs fall back to the row index
+            keys = np.where(is_numeric, ids, np.arange(len(ids)))
+            return keys, label_values
 
         return None
 
@@ -625,7 +1553,7 @@ class SpatialDataLoader:
         # Get the appropriate scale level
         if hasattr(image, "__iter__") and not isinstance(image, xr.DataArray):
             # Multi-scale image (DataTree)
-            image_data = sd.get_pyramid_levels(image, n=scale_level)
+            image_data = self._get_level("images", image_name, scale_level)
         else:
             # Single-scale image
             image_data = image
@@ -658,6 +1586,13 @@ class SpatialDataLoader:
                 except Exception:
                     channel_names = [f"Channel_{i}" for i in range(n_channels)]
 
+                # Read the whole cube in one pass when it fits the budget so
+                # shared chunks are decoded once rather than once per channel
+                if hasattr(image_data, "compute") and (
+                    image_data.nbytes <= _CHANNEL_BATCH_BYTES
+                ):
+                    image_data = image_data.compute()
+
                 for i in range(n_channels):
                     try:
                         ch_da = image_data.isel({"c": i})
@@ -742,7 +1677,8 @@ class SpatialDataLoader:
         Returns
         -------
         List[Tuple[List[QPointF], str, int]]
-            List of (polygon_points, label, original_mask_id) tuples.
+            List of (polygon_points, label, original_mask_id) tuples. Their
+            (x, y) vertex centroids are kept in ``self.cell_centroids``.
         """
         if not self.get_available_labels():
             return []
@@ -770,7 +1706,7 @@ class SpatialDataLoader:
 
         # Get the appropriate scale level (highest resolution)
         if hasattr(labels, "__iter__") and not isinstance(labels, xr.DataArray):
-            label_data = sd.get_pyramid_levels(labels, n=0)
+            label_data = self._get_level("labels", label_name, 0)
         else:
             label_data = labels
 
@@ -780,94 +1716,13 @@ class SpatialDataLoader:
             if hasattr(label_data, "compute")
             else label_data.values
         )
-        label_array = np.squeeze(np.asarray(label_array))
-
-        polygons = []
-
-        # Convert to integer array for find_objects
-        try:
-            label_array_int = label_array.astype(np.int32)
-        except Exception:
-            # Fallback: convert to numeric first
-            flat = label_array.ravel()
-            numeric = pd.to_numeric(flat, errors="coerce")
-            label_array_int = numeric.values.reshape(label_array.shape)
-            label_array_int = np.nan_to_num(label_array_int, 0).astype(np.int32)
-
-        # FAST: Pre-compute bounding boxes for ALL labels at once
-        # slices[i] contains the bounding box for label (i+1)
-        slices = find_objects(label_array_int)
-
-        if not slices:
-            return []
-
-        # Get valid label IDs that have bounding boxes
-        valid_labels = [i + 1 for i, s in enumerate(slices) if s is not None]
-
-        # Limit number of cells
-        total_cells = len(valid_labels)
-        if total_cells > max_cells:
-            print(f"Warning: Found {total_cells} cells, limiting to {max_cells}")
-            valid_labels = valid_labels[:max_cells]
-
-        # Get image dimensions
-        img_height, img_width = label_array_int.shape
-        padding = 25  # Pixel padding around bounding box
-
-        # Iterate over valid label ids
-        for idx, label_id in enumerate(valid_labels):
-            # Report progress
-            if progress_callback and idx % 100 == 0:
-                progress_callback(idx, len(valid_labels))
-
-            # 1) Get pre-computed bounding box (instant lookup!)
-            bbox = slices[label_id - 1]  # slices[0] is for label 1
-
-            if bbox is None:
-                continue
-
-            # 2) Add padding to bounding box
-            row_min = max(0, bbox[0].start - padding)
-            row_max = min(img_height, bbox[0].stop + padding)
-            col_min = max(0, bbox[1].start - padding)
-            col_max = min(img_width, bbox[1].stop + padding)
-
-            # Extract the bounding box region from the label array
-            region = label_array_int[row_min:row_max, col_min:col_max]
-
-            # Create binary mask for this specific label in the region
-            mask_bbox = (region == label_id).astype(np.uint8)
-
-            # Check if cell has enough pixels
-            if np.sum(mask_bbox) < min_area:
-                continue
-
-            # 3) Find contours in the bounding box
-            contours = measure.find_contours(mask_bbox, 0.5)
-
-            if not contours:
-                continue
-
-            # Use the longest contour (outer boundary)
-            contour = max(contours, key=len)
-
-            # Check minimum points
-            if len(contour) < 3:
-                continue
-
-            # Approximate polygon to reduce points
-            coords = measure.approximate_polygon(contour, tolerance=1.0)
-
-            # Convert to QPointF and offset by bounding box origin to map to original image
-            if len(coords) >= 3:
-                # coords are (row, col) in bbox space, need to add bbox origin offsets
-                points = [
-                    QPointF(float(x[1] + col_min), float(x[0] + row_min))
-                    for x in coords
-                ]
-                # Store both the label string and the original mask ID
-                polygons.append((points, f"Cell_{int(label_id)}", int(label_id)))
-
+        polygons, self.cell_centroids = extract_polygons_from_label_image(
+            label_array,
+            min_area=min_area,
+            max_cells=max_cells,
+            progress_callback=progress_callback,
+            return_centroids=True,
+        )
         return polygons
 
     def extract_polygons_from_shapes(
@@ -945,16 +1800,102 @@ class SpatialDataLoader:
             "cellpick_selected_cells",
         ]:
             if label_name in self.get_available_labels():
-                labels = self.sdata.labels[label_name]
-                label_data = (
-                    labels.compute() if hasattr(labels, "compute") else labels.values
-                )
-                label_array = np.squeeze(np.asarray(label_data))
-                return label_array.shape
+                shape = self.sdata.labels[label_name].shape
+                return tuple(int(n) for n in shape if n != 1)
         return None
 
+    def _annotation_windows(
+        self, label_name: str, min_area: int = 1
+    ) -> Dict[int, Tuple[np.ndarray, int, int]]:
+        """
+        Read the regions of a CellPick annotation label chunk by chunk.
+
+        The non-zero IDs of every chunk are collected first; each region is
+        then computed only over the chunks it occurs in, so sparse annotations
+        on large masks never materialize the full label array.
+
+        Parameters
+        ----------
+        label_name : str
+            Name of the label element.
+        min_area : int
+            Regions with fewer pixels are skipped before they are read.
+
+        Returns
+        -------
+        Dict[int, Tuple[np.ndarray, int, int]]
+            Mapping from label ID to ``(mask, row_offset, col_offset)``. The
+            uint8 mask is cropped to the label's bounding box and padded with
+            background wherever it borders other image content, so contours
+            close as on the full array.
+        """
+        labels = self.sdata.labels[label_name]
+        data = labels.data if hasattr(labels, "data") else np.asarray(labels.values)
+        data = data.squeeze()
+
+        height, width = data.shape
+        windows = {}
+        for label_id, r0, c0, mask in self._iter_label_masks(data, min_area):
+            # Crop to the label's own bounding box
+            rows, cols = find_objects(mask)[0]
+            mask = mask[rows, cols]
+            r0 += rows.start
+            c0 += cols.start
+            r1 = r0 + mask.shape[0]
+            c1 = c0 + mask.shape[1]
+            pad = ((int(r0 > 0), int(r1 < height)), (int(c0 > 0), int(c1 < width)))
+            windows[label_id] = (np.pad(mask, pad), r0 - pad[0][0], c0 - pad[1][0])
+        return windows
+
+    @staticmethod
+    def _iter_label_masks(data, min_area: int = 1):
+        """
+        Yield ``(label_id, row_offset, col_offset, mask)`` for every label
+        with at least ``min_area`` pixels.
+
+        In-memory arrays get all bounding boxes from one ``find_objects``
+        pass; dask arrays are read only over the chunks each label occurs in.
+        Region sizes come from the same pass that finds the IDs.
+        """
+        if not isinstance(data, da.Array):
+            if not np.issubdtype(data.dtype, np.integer):
+                data = data.astype(np.int32)
+            # find_objects and _label_areas both skip negative IDs, so the
+            # mask is used as-is instead of a clipped H x W copy
+            slices = find_objects(data)
+            counts = _label_areas(data, len(slices))
+            for i, bbox in enumerate(slices):
+                if bbox is not None and counts[i + 1] >= min_area:
+                    mask = (data[bbox] == i + 1).astype(np.uint8)
+                    yield i + 1, bbox[0].start, bbox[1].start, mask
+            return
+
+        row_edges = np.cumsum((0,) + data.chunks[0])
+        col_edges = np.cumsum((0,) + data.chunks[1])
+        blocks = data.to_delayed().ravel()
+        block_ids = dask.compute(*[dask.delayed(_nonzero_ids)(b) for b in blocks])
+
+        n_block_cols = len(col_edges) - 1
+        blocks_of: Dict[int, List[Tuple[int, int]]] = {}
+        areas: Dict[int, int] = {}
+        for k, (ids, counts) in enumerate(block_ids):
+            for label_id, count in zip(ids.tolist(), counts.tolist()):
+                blocks_of.setdefault(label_id, []).append(divmod(k, n_block_cols))
+                areas[label_id] = areas.get(label_id, 0) + count
+
+        for label_id in sorted(blocks_of):
+            if areas[label_id] < min_area:
+                continue
+            block_rows, block_cols = zip(*blocks_of[label_id])
+            r0, r1 = row_edges[min(block_rows)], row_edges[max(block_rows) + 1]
+            c0, c1 = col_edges[min(block_cols)], col_edges[max(block_cols) + 1]
+            window = np.asarray(data[r0:r1, c0:c1])
+            yield label_id, int(r0), int(c0), (window == label_id).astype(np.uint8)
+
     def load_cellpick_selected_cells(
-        self, all_cell_polygons: List[Tuple[List[Any], str]]
+        self,
+        all_cell_polygons: List[Tuple[List[Any], str]],
+        centroids: Optional[np.ndarray] = None,
     ) -> List[int]:
         """
         Load selected cell indices from CellPick annotations.
@@ -965,6 +1906,9 @@ class SpatialDataLoader:
         ----------
         all_cell_polygons : List[Tuple[List[QPointF], str]]
             All loaded cell polygons with their labels.
+        centroids : Optional[np.ndarray]
+            Precomputed ``(M, 2)`` (x, y) vertex centroids aligned with
+            ``all_cell_polygons``. Computed from the points if omitted.
 
         Returns
         -------
@@ -974,50 +1918,53 @@ class SpatialDataLoader:
         if "cellpick_selected_cells" not in self.get_available_labels():
             return []
 
-        labels = self.sdata.labels["cellpick_selected_cells"]
-        label_data = labels.compute() if hasattr(labels, "compute") else labels.values
-        label_array = np.squeeze(np.asarray(label_data))
+        windows = self._annotation_windows("cellpick_selected_cells")
 
-        # Get unique label IDs (excluding 0 background)
-        unique_ids = np.unique(label_array)
-        unique_ids = unique_ids[unique_ids > 0]
-
-        if len(unique_ids) == 0:
+        if len(windows) == 0:
             return []
 
         # Extract centroids of selected cell masks
         selected_centroids = []
-        for cell_id in unique_ids:
-            ys, xs = np.where(label_array == cell_id)
-            if len(xs) > 0:
-                centroid = (float(np.mean(xs)), float(np.mean(ys)))
-                selected_centroids.append(centroid)
+        for mask, r_off, c_off in windows.values():
+            cy, cx = center_of_mass(mask)
+            selected_centroids.append((float(cx) + c_off, float(cy) + r_off))
 
         # Match to loaded polygons by finding closest centroid
+        if centroids is not None and len(centroids) == len(all_cell_polygons):
+            poly_indices = list(range(len(all_cell_polygons)))
+            poly_centroids = np.asarray(centroids, dtype=np.float64)
+        else:
+            poly_indices = [
+                idx
+                for idx, (points, _) in enumerate(all_cell_polygons)
+                if len(points) > 0
+            ]
+            poly_centroids = np.empty((len(poly_indices), 2), dtype=np.float64)
+            for row, idx in enumerate(poly_indices):
+                points = all_cell_polygons[idx][0]
+                poly_centroids[row, 0] = sum(pt.x() for pt in points) / len(points)
+                poly_centroids[row, 1] = sum(pt.y() for pt in points) / len(points)
+        if len(poly_indices) == 0:
+            return []
+
+        # Only keep matches that are close enough (within 50 pixels)
+        tree = cKDTree(poly_centroids)
+        selected_centroids = np.asarray(selected_centroids)
+        dists, _ = tree.query(selected_centroids, distance_upper_bound=50.0)
+        matched = dists < 50
+        if not matched.any():
+            return []
+        # The tree returns an arbitrary one of several equidistant polygons, so
+        # near-ties are re-ranked with a linear scan's arithmetic and the
+        # lowest index wins
+        points = selected_centroids[matched]
+        candidates = tree.query_ball_point(points, r=dists[matched] * (1 + 1e-9))
         selected_indices = []
-        for sel_centroid in selected_centroids:
-            best_idx = None
-            best_dist = float("inf")
-
-            for idx, (points, label) in enumerate(all_cell_polygons):
-                # Compute polygon centroid
-                if len(points) > 0:
-                    poly_centroid_x = sum(pt.x() for pt in points) / len(points)
-                    poly_centroid_y = sum(pt.y() for pt in points) / len(points)
-
-                    # Distance to selected centroid
-                    dist = (
-                        (poly_centroid_x - sel_centroid[0]) ** 2
-                        + (poly_centroid_y - sel_centroid[1]) ** 2
-                    ) ** 0.5
-
-                    if dist < best_dist:
-                        best_dist = dist
-                        best_idx = idx
-
-            # Only add if match is close enough (within 50 pixels)
-            if best_idx is not None and best_dist < 50:
-                selected_indices.append(best_idx)
+        for (x, y), rows in zip(points, candidates):
+            rows = np.sort(rows)
+            near = poly_centroids[rows]
+            row_dists = ((near[:, 0] - x) ** 2 + (near[:, 1] - y) ** 2) ** 0.5
+            selected_indices.append(poly_indices[int(rows[np.argmin(row_dists)])])
 
         return selected_indices
 
@@ -1035,31 +1982,21 @@ class SpatialDataLoader:
             return []
 
         print("[Load] Loading cellpick_landmarks...")
-        labels = self.sdata.labels["cellpick_landmarks"]
-        label_data = labels.compute() if hasattr(labels, "compute") else labels.values
-        label_array = np.squeeze(np.asarray(label_data))
+        windows = self._annotation_windows("cellpick_landmarks", min_area=3)
 
         landmarks = []
-        unique_ids = np.unique(label_array)
-        unique_ids = unique_ids[unique_ids > 0]
+        unique_ids = np.array(list(windows))
         print(f"[Load] Found {len(unique_ids)} landmark IDs: {unique_ids}")
 
-        for lnd_id in unique_ids:
-            # Create a binary mask for this landmark
-            mask = (label_array == lnd_id).astype(np.uint8)
-
-            # Find contours (outline of the region)
-            contours = measure.find_contours(mask, 0.5)
+        for lnd_id, (mask, r_off, c_off) in windows.items():
 
-            if len(contours) > 0:
-                # Use the longest contour
-                contour = max(contours, key=len)
+            # Outline of the region, simplified
+            simplified = _mask_contour(mask, tolerance=2.0)
 
-                # Simplify the polygon
-                simplified = measure.approximate_polygon(contour, tolerance=2.0)
+            if simplified is not None:
 
                 # Convert to QPointF (contours return row, col, so swap: col=x, row=y)
-                points = [QPointF(float(x[1]), float(x[0])) for x in simplified]
+                points = _rowcol_to_qpoints(simplified, r_off, c_off)
 
                 # Ensure we have at least 3 points for a valid polygon
                 if len(points) >= 3:
@@ -1089,31 +2026,21 @@ class SpatialDataLoader:
             return []
 
         print("[Load] Loading cellpick_AR...")
-        labels = self.sdata.labels["cellpick_AR"]
-        label_data = labels.compute() if hasattr(labels, "compute") else labels.values
-        label_array = np.squeeze(np.asarray(label_data))
+        windows = self._annotation_windows("cellpick_AR", min_area=3)
 
         active_regions = []
-        unique_ids = np.unique(label_array)
-        unique_ids = unique_ids[unique_ids > 0]
+        unique_ids = np.array(list(windows))
         print(f"[Load] Found {len(unique_ids)} AR IDs: {unique_ids}")
 
-        for ar_id in unique_ids:
-            # Create a binary mask for this AR
-            mask = (label_array == ar_id).astype(np.uint8)
+        for ar_id, (mask, r_off, c_off) in windows.items():
 
-            # Find contours (outline of the region)
-            contours = measure.find_contours(mask, 0.5)
+            # Outline of the region, simplified
+            coords = _mask_contour(mask, tolerance=2.0)
 
-            if len(contours) > 0:
-                # Use the longest contour
-                contour = max(contours, key=len)
-
-                # Simplify the polygon
-                coords = measure.approximate_polygon(contour, tolerance=2.0)
+            if coords is not None:
 
                 # Convert to QPointF (contours return row, col, so swap: col=x, row=y)
-                points = [QPointF(float(x[1]), float(x[0])) for x in coords]
+                points = _rowcol_to_qpoints(coords, r_off, c_off)
 
                 if len(points) >= 3:
                     print(f"[Load]   AR {ar_id} has {len(points)} points")
@@ -1182,52 +2109,29 @@ class SpatialDataLoader:
             raise ValueError("No label column found in CSV")
 
         # Score columns by number of non-null unique values
+        has_values = df[candidate_cols].notna().any()
         best_col = None
         best_score = -1
         for col in candidate_cols:
-            try:
-                series = df[col]
+            score = 0
+            if has_values[col]:
                 # count non-null unique values excluding empty strings
-                non_null = series.dropna().astype(str).map(lambda s: s.strip())
-                non_null = non_null[non_null != ""]
-                score = non_null.nunique()
-            except Exception:
-                score = 0
+                non_null = df[col].dropna().astype(str).str.strip()
+                score = non_null[non_null != ""].nunique()
             if score > best_score:
                 best_score = score
                 best_col = col
+            # No column can score above the row count, and ties keep the first
+            if best_score >= len(df):
+                break
 
         label_col = best_col
         print(f"[CSV Loader] Using label column: {label_col} (score={best_score})")
 
-        labels_dict = {}
-        cell_ids = df[cell_id_col].tolist()
-        label_values = df[label_col].tolist()
-
-        # Helper to coerce to int if possible (strings like '1', floats that are integral)
-        def _coerce_int(x):
-            try:
-                if isinstance(x, (int, np.integer)):
-                    return int(x)
-                if isinstance(x, float) and x.is_integer():
-                    return int(x)
-                if isinstance(x, str):
-                    s = x.strip()
-                    if s.isdigit():
-                        return int(s)
-                    # handle floats in string like '1.0'
-                    if s.replace(".", "", 1).isdigit():
-                        f = float(s)
-                        if f.is_integer():
-                            return int(f)
-            except Exception:
-                pass
-            return None
-
-        coerced_ids = [_coerce_int(cid) for cid in cell_ids]
-        numeric_ids = [c for c in coerced_ids if c is not None]
-        min_id = min(numeric_ids) if numeric_ids else None
-        max_id = max(numeric_ids) if numeric_ids else None
+        cell_ids, numeric = _coerce_int_ids(df[cell_id_col], decimal_strings=True)
+        label_values = _normalize_labels(df[label_col])
+        min_id = int(cell_ids[numeric].min()) if numeric.any() else None
+        max_id = int(cell_ids[numeric].max()) if numeric.any() else None
 
         print(f"[CSV Loader] Cell ID range (coerced): {min_id} to {max_id}")
 
@@ -1243,41 +2147,35 @@ class SpatialDataLoader:
                 if max_id == len(cell_ids):
                     use_one_based = True
 
-        duplicates = {}
-        for i, (raw_id, label) in enumerate(zip(cell_ids, label_values)):
-            cid = coerced_ids[i]
-            if cid is None:
-                # non-numeric id: use sequential index
-                mapped = len(labels_dict)
-            else:
-                mapped = cid - 1 if use_one_based else cid
-
-            # Normalize label
-            try:
-                if pd.isna(label):
-                    label = ""
-                elif isinstance(label, str):
-                    label = label.strip()
-            except Exception:
-                pass
-
-            if mapped in labels_dict:
-                # duplicate assignment
-                duplicates.setdefault(mapped, 0)
-                duplicates[mapped] += 1
-
-            labels_dict[int(mapped)] = label
-
-        # Logging summary
+        mapped = cell_ids - 1 if use_one_based else cell_ids
+        if not numeric.all():
+            # non-numeric id: use the number of cells mapped so far
+            seen = set()
+            mapped = mapped.tolist()
+            for i, is_numeric in enumerate(numeric.tolist()):
+                if not is_numeric:
+                    mapped[i] = len(seen)
+                seen.add(mapped[i])
+            mapped = np.asarray(mapped, dtype=np.int64)
+
+        labels_dict = dict(zip(mapped.tolist(), label_values.tolist()))
+        key_counts = np.unique(mapped, return_counts=True)[1]
+        duplicates = key_counts[key_counts > 1]
+
+        # Logging summary; without duplicate IDs the dict holds every row's
+        # label, so they are counted from the Series instead of the dict
         try:
-            from collections import Counter
-
-            cnt = Counter(labels_dict.values())
+            final_labels = (
+                label_values
+                if len(duplicates) == 0
+                else pd.Series(list(labels_dict.values()), dtype=object)
+            )
+            cnt = final_labels.value_counts(sort=False, dropna=False)
             print(
                 f"[CSV Loader] Loaded {len(labels_dict)} labels (duplicates: {len(duplicates)})"
             )
-            print(f"[CSV Loader] Unique labels ({len(cnt)}): {list(cnt.keys())}")
-            print(f"[CSV Loader] Counts per label: {dict(cnt)}")
+            print(f"[CSV Loader] Unique labels ({len(cnt)}): {cnt.index.tolist()}")
+            print(f"[CSV Loader] Counts per label: {cnt.to_dict()}")
             print(
                 f"[CSV Loader] Sample mapping: {dict(list(labels_dict.items())[:10])}"
             )
@@ -1344,7 +2242,6 @@ class SpatialDataExporter:
             )
 
         from spatialdata.models import Labels2DModel
-        from skimage.draw import polygon as draw_polygon
         import time
 
         output_path = Path(output_path)
@@ -1355,6 +2252,11 @@ class SpatialDataExporter:
         start_time = time.time()
         print(f"[Export] Starting export to {output_path}")
 
+        # Every element gets its own transformation dict: spatialdata keeps it
+        # by reference, so a shared one would be changed by set_transformation
+        # on any of them
+        identity = Identity()
+
         # Load existing SpatialData if provided, otherwise create new
         if input_path and Path(input_path).exists():
             print(f"[Export] Loading existing SpatialData from {input_path}")
@@ -1378,28 +2280,33 @@ class SpatialDataExporter:
                 for ch_data, ch_name in image_channels:
                     # Create xarray DataArray for the channel
                     ch_array = xr.DataArray(
-                        ch_data[np.newaxis, :, :],  # Add C dimension
+                        da.from_array(
+                            ch_data[np.newaxis, :, :],  # Add C dimension
+                            chunks=(1,) + _EXPORT_CHUNKS,
+                        ),
                         dims=["c", "y", "x"],
-                        coords={
-                            "c": [ch_name],
-                            "y": np.arange(ch_data.shape[0]),
-                            "x": np.arange(ch_data.shape[1]),
-                        },
+                        coords={"c": [ch_name]},
                     )
 
                     # Parse as Image2DModel
                     sdata.images[ch_name] = Image2DModel.parse(
-                        ch_array, transformations={coordinate_system: Identity()}
+                        ch_array, transformations={coordinate_system: identity}
                     )
                     print(f"[Export]   Added channel: {ch_name}")
 
-        transformations = {coordinate_system: Identity()}
-
         # Create label masks if we have image shape
         if image_shape is not None:
             height, width = image_shape
             print(f"[Export] Image shape: {height} x {width}")
 
+            # Cells in both the full and the selected mask are rasterized once
+            raster_cache: Dict[int, np.ndarray] = {}
+            shared_ids = set()
+            if all_polygons and selected_polygons:
+                shared_ids = {id(poly) for poly in all_polygons} & {
+                    id(poly) for poly in selected_polygons
+                }
+
             # 0. Create full segmentation mask if all_polygons provided (for IMAGE mode)
             if all_polygons:
                 if progress_callback:
@@ -1412,33 +2319,33 @@ class SpatialDataExporter:
                 print(
                     f"[Export] Creating full segmentation mask ({len(all_polygons)} cells)"
                 )
-                segmentation_mask = np.zeros((height, width), dtype=np.uint32)
+                segmentation_mask = np.zeros(
+                    (height, width), dtype=_label_mask_dtype(len(all_polygons))
+                )
 
-                for idx, poly in enumerate(all_polygons, start=1):
-                    if idx % 100 == 0:
-                        elapsed = time.time() - step_time
-                        print(
-                            f"[Export]   Processed {idx}/{len(all_polygons)} cells ({elapsed:.2f}s)"
-                        )
+                n_cells = len(all_polygons)
+                for start in range(0, n_cells, 100):
+                    if start > 0:
+                        # Console progress every 10 batches; the UI gets each one
+                        if start % 1000 == 0:
+                            elapsed = time.time() - step_time
+                            print(
+                                f"[Export]   Processed {start}/{n_cells} cells ({elapsed:.2f}s)"
+                            )
                         if progress_callback:
-                            pct = 15 + int(5 * idx / len(all_polygons))
+                            pct = 15 + int(5 * start / n_cells)
                             progress_callback(
-                                f"Creating segmentation: {idx}/{len(all_polygons)} cells...",
+                                f"Creating segmentation: {start}/{n_cells} cells...",
                                 pct,
                             )
 
-                    coords = [(pt.y(), pt.x()) for pt in poly.points]
-                    if len(coords) >= 3:
-                        try:
-                            rr, cc = draw_polygon(
-                                [c[0] for c in coords],
-                                [c[1] for c in coords],
-                                shape=(height, width),
-                            )
-                            segmentation_mask[rr, cc] = idx
-                        except Exception as e:
-                            print(f"[Export]   Warning: Failed to draw cell {idx}: {e}")
-                            continue
+                    _fill_shared_polygons(
+                        segmentation_mask,
+                        all_polygons[start : start + 100],
+                        start + 1,
+                        raster_cache,
+                        shared_ids,
+                    )
 
                 print(
                     f"[Export] Segmentation mask created in {time.time() - step_time:.2f}s"
@@ -1446,12 +2353,11 @@ class SpatialDataExporter:
 
                 # Add as labels
                 seg_da = xr.DataArray(
-                    segmentation_mask,
+                    da.from_array(segmentation_mask, chunks=_EXPORT_CHUNKS),
                     dims=["y", "x"],
-                    coords={"y": np.arange(height), "x": np.arange(width)},
                 )
                 sdata.labels["cells"] = Labels2DModel.parse(
-                    seg_da, transformations=transformations
+                    seg_da, transformations={coordinate_system: identity}
                 )
 
             # 1. Create mask for selected cells
@@ -1465,38 +2371,33 @@ class SpatialDataExporter:
                 print(
                     f"[Export] Creating selected cells mask ({len(selected_polygons)} cells)"
                 )
-                selected_mask = np.zeros((height, width), dtype=np.uint32)
+                selected_mask = np.zeros(
+                    (height, width), dtype=_label_mask_dtype(len(selected_polygons))
+                )
 
-                for idx, poly in enumerate(selected_polygons, start=1):
-                    if idx % 50 == 0:
-                        elapsed = time.time() - step_time
-                        print(
-                            f"[Export]   Processed {idx}/{len(selected_polygons)} cells ({elapsed:.2f}s)"
-                        )
+                n_selected = len(selected_polygons)
+                for start in range(0, n_selected, 50):
+                    if start > 0:
+                        # Console progress every 10 batches; the UI gets each one
+                        if start % 500 == 0:
+                            elapsed = time.time() - step_time
+                            print(
+                                f"[Export]   Processed {start}/{n_selected} cells ({elapsed:.2f}s)"
+                            )
                         if progress_callback:
-                            pct = 20 + int(20 * idx / len(selected_polygons))
+                            pct = 20 + int(20 * start / n_selected)
                             progress_callback(
-                                f"Creating mask: {idx}/{len(selected_polygons)} cells...",
+                                f"Creating mask: {start}/{n_selected} cells...",
                                 pct,
                             )
 
-                    # Convert polygon to mask using polygon fill (MUCH faster than point-by-point)
-                    coords = [
-                        (pt.y(), pt.x()) for pt in poly.points
-                    ]  # (row, col) for skimage
-                    if len(coords) >= 3:
-                        try:
-                            rr, cc = draw_polygon(
-                                [c[0] for c in coords],
-                                [c[1] for c in coords],
-                                shape=(height, width),
-                            )
-                            selected_mask[rr, cc] = idx
-                        except Exception as e:
-                            print(
-                                f"[Export]   Warning: Failed to draw polygon {idx}: {e}"
-                            )
-                            continue
+                    _fill_shared_polygons(
+                        selected_mask,
+                        selected_polygons[start : start + 50],
+                        start + 1,
+                        raster_cache,
+                        shared_ids,
+                    )
 
                 print(
                     f"[Export] Selected cells mask created in {time.time() - step_time:.2f}s"
@@ -1504,12 +2405,11 @@ class SpatialDataExporter:
 
                 # Convert to xarray and add to sdata
                 selected_da = xr.DataArray(
-                    selected_mask,
+                    da.from_array(selected_mask, chunks=_EXPORT_CHUNKS),
                     dims=["y", "x"],
-                    coords={"y": np.arange(height), "x": np.arange(width)},
                 )
                 sdata.labels["cellpick_selected_cells"] = Labels2DModel.parse(
-                    selected_da, transformations=transformations
+                    selected_da, transformations={coordinate_system: identity}
                 )
 
             # 2. Create mask for active regions
@@ -1523,33 +2423,22 @@ class SpatialDataExporter:
                 print(
                     f"[Export] Creating active regions mask ({len(active_regions)} ARs)"
                 )
-                ar_mask = np.zeros((height, width), dtype=np.uint32)
-
-                for idx, ar_points in enumerate(active_regions, start=1):
-                    coords = [(pt.y(), pt.x()) for pt in ar_points]
-                    if len(coords) >= 3:
-                        try:
-                            rr, cc = draw_polygon(
-                                [c[0] for c in coords],
-                                [c[1] for c in coords],
-                                shape=(height, width),
-                            )
-                            ar_mask[rr, cc] = idx
-                        except Exception as e:
-                            print(f"[Export]   Warning: Failed to draw AR {idx}: {e}")
-                            continue
+                ar_mask = np.zeros(
+                    (height, width), dtype=_label_mask_dtype(len(active_regions))
+                )
+
+                _fill_polygons(ar_mask, active_regions)
 
                 print(
                     f"[Export] Active regions mask created in {time.time() - step_time:.2f}s"
                 )
 
                 ar_da = xr.DataArray(
-                    ar_mask,
+                    da.from_array(ar_mask, chunks=_EXPORT_CHUNKS),
                     dims=["y", "x"],
-                    coords={"y": np.arange(height), "x": np.arange(width)},
                 )
                 sdata.labels["cellpick_AR"] = Labels2DModel.parse(
-                    ar_da, transformations=transformations
+                    ar_da, transformations={coordinate_system: identity}
                 )
 
             # 3. Create mask for landmarks (as points/small regions)
@@ -1561,36 +2450,22 @@ class SpatialDataExporter:
 
                 step_time = time.time()
                 print(f"[Export] Creating landmarks mask ({len(landmarks)} landmarks)")
-                lnd_mask = np.zeros((height, width), dtype=np.uint32)
-
-                for idx, lnd_points in enumerate(landmarks, start=1):
-                    # Convert polygon points to coordinates (y, x)
-                    coords = [(pt.y(), pt.x()) for pt in lnd_points]
-                    if len(coords) >= 3:
-                        try:
-                            rr, cc = draw_polygon(
-                                [c[0] for c in coords],
-                                [c[1] for c in coords],
-                                shape=(height, width),
-                            )
-                            lnd_mask[rr, cc] = idx
-                        except Exception as e:
-                            print(
-                                f"[Export]   Warning: Failed to draw landmark {idx}: {e}"
-                            )
-                            continue
+                lnd_mask = np.zeros(
+                    (height, width), dtype=_label_mask_dtype(len(landmarks))
+                )
+
+                _fill_polygons(lnd_mask, landmarks)
 
                 print(
                     f"[Export] Landmarks mask created in {time.time() - step_time:.2f}s"
                 )
 
                 lnd_da = xr.DataArray(
-                    lnd_mask,
+                    da.from_array(lnd_mask, chunks=_EXPORT_CHUNKS),
                     dims=["y", "x"],
-                    coords={"y": np.arange(height), "x": np.arange(width)},
                 )
                 sdata.labels["cellpick_landmarks"] = Labels2DModel.parse(
-                    lnd_da, transformations=transformations
+                    lnd_da, transformations={coordinate_system: identity}
                 )
 
         # Write to disk
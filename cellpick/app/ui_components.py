@@ -1,32 +1,56 @@
-from copy import deepcopy
-from typing import Any, List, Optional, Tuple
+import os
+from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
 from PySide6.QtCore import (
+    QEvent,
     QPointF,
+    QRect,
     QRectF,
     Qt,
+    QTimer,
     Signal,
 )
 from PySide6.QtGui import (
     QColor,
+    QGuiApplication,
     QMouseEvent,
     QPainter,
+    QPainterPath,
     QPen,
+    QPixmap,
+    QPixmapCache,
     QPolygonF,
+    QShowEvent,
     QBrush,
     QLinearGradient,
 )
 from PySide6.QtWidgets import (
+    QButtonGroup,
+    QComboBox,
     QDialog,
+    QFileDialog,
+    QFormLayout,
     QGraphicsItem,
+    QGraphicsView,
+    QGroupBox,
     QLabel,
+    QMessageBox,
     QProgressBar,
     QPushButton,
+    QRadioButton,
     QVBoxLayout,
     QWidget,
     QHBoxLayout,
 )
 
+try:
+    from PySide6.QtOpenGLWidgets import QOpenGLWidget
+
+    OPENGL_AVAILABLE = True
+except ImportError:
+    OPENGL_AVAILABLE = False
+
 
 class RangeSlider(QWidget):
     """
@@ -65,8 +89,15 @@ class RangeSlider(QWidget):
         self._min_val = 0.0  # 0-1 range
         self._max_val = 1.0  # 0-1 range
         self._dragging = None  # 'min', 'max', or None
+        self._emit_pending = False
         self._handle_width = 8
         self._track_height = 6
+        # Paint resources are built once; only the gradient follows the color
+        self._track_brush = QBrush(QColor(40, 40, 40))
+        self._handle_brush = QBrush(QColor(60, 60, 60))
+        self._handle_pen = QPen(QColor(200, 200, 200), 1)
+        self._gradient = QLinearGradient()
+        self._update_gradient()
         self.setMinimumHeight(20)
         self.setMinimumWidth(100)
         self.setCursor(Qt.PointingHandCursor)
@@ -92,8 +123,8 @@ class RangeSlider(QWidget):
         max_val : float
             Maximum value (clamped to 0-1).
         """
-        self._min_val = max(0.0, min(1.0, min_val))
-        self._max_val = max(0.0, min(1.0, max_val))
+        self._min_val = 0.0 if min_val < 0.0 else (1.0 if min_val > 1.0 else min_val)
+        self._max_val = 0.0 if max_val < 0.0 else (1.0 if max_val > 1.0 else max_val)
         if self._min_val > self._max_val:
             self._min_val, self._max_val = self._max_val, self._min_val
         self.update()
@@ -106,8 +137,27 @@ class RangeSlider(QWidget):
     def _x_to_val(self, x: int) -> float:
         """Convert x coordinate to value (0-1)."""
         usable_width = self.width() - 2 * self._handle_width
+        if usable_width <= 0:
+            return 0.0
         val = (x - self._handle_width) / usable_width
-        return max(0.0, min(1.0, val))
+        return 0.0 if val < 0.0 else (1.0 if val > 1.0 else val)
+
+    def _range_rect(self) -> QRect:
+        """Return the widget area covered by the active range and handles."""
+        min_x = self._val_to_x(self._min_val)
+        max_x = self._val_to_x(self._max_val)
+        return QRect(
+            min_x - self._handle_width,
+            0,
+            max_x - min_x + 2 * self._handle_width,
+            self.height(),
+        )
+
+    def _update_gradient(self) -> None:
+        """Set the cached active-range gradient stops from the current color."""
+        base_color = QColor(self.color[0], self.color[1], self.color[2])
+        self._gradient.setColorAt(0, base_color.darker(120))
+        self._gradient.setColorAt(1, base_color)
 
     def set_color(self, color: Tuple[int, int, int]) -> None:
         """
@@ -118,19 +168,27 @@ class RangeSlider(QWidget):
         color : Tuple[int, int, int]
             RGB color for the active range.
         """
+        if tuple(color) == tuple(self.color):
+            return
         self.color = color
+        self._update_gradient()
         self.update()
 
     def paintEvent(self, event) -> None:
         """Paint the slider track, active range, and handles."""
+        # Nothing to draw when the slider is too narrow to have a track
+        if self.width() <= 2 * self._handle_width:
+            return
+
+        # The track and range bands are axis-aligned and drawn without
+        # antialiasing; only the outlined handles use it
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.Antialiasing)
 
         h = self.height()
         track_y = (h - self._track_height) // 2
 
         # Draw background track (dark)
-        painter.setBrush(QBrush(QColor(40, 40, 40)))
+        painter.setBrush(self._track_brush)
         painter.setPen(Qt.NoPen)
         painter.drawRoundedRect(
             self._handle_width,
@@ -145,13 +203,11 @@ class RangeSlider(QWidget):
         min_x = self._val_to_x(self._min_val)
         max_x = self._val_to_x(self._max_val)
 
-        # Create gradient for the active range
-        gradient = QLinearGradient(min_x, 0, max_x, 0)
-        base_color = QColor(self.color[0], self.color[1], self.color[2])
-        gradient.setColorAt(0, base_color.darker(120))
-        gradient.setColorAt(1, base_color)
+        # Stretch the cached gradient over the active range
+        self._gradient.setStart(min_x, 0)
+        self._gradient.setFinalStop(max_x, 0)
 
-        painter.setBrush(QBrush(gradient))
+        painter.setBrush(self._gradient)
         painter.drawRoundedRect(
             min_x,
             track_y,
@@ -166,8 +222,9 @@ class RangeSlider(QWidget):
         handle_y = 2
 
         # Min handle
-        painter.setBrush(QBrush(QColor(60, 60, 60)))
-        painter.setPen(QPen(QColor(200, 200, 200), 1))
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setBrush(self._handle_brush)
+        painter.setPen(self._handle_pen)
         painter.drawRoundedRect(
             min_x - self._handle_width // 2,
             handle_y,
@@ -222,13 +279,24 @@ class RangeSlider(QWidget):
     def _update_value(self, x: int) -> None:
         """Update the dragged handle value and emit rangeChanged signal."""
         val = self._x_to_val(x)
+        old_rect = self._range_rect()
 
         if self._dragging == "min":
             self._min_val = min(val, self._max_val - 0.01)
         elif self._dragging == "max":
             self._max_val = max(val, self._min_val + 0.01)
 
-        self.update()
+        # Only the old and new active range change (the gradient spans it)
+        self.update(old_rect.united(self._range_rect()))
+
+        # A burst of mouse moves handled in one event-loop pass emits once
+        if not self._emit_pending:
+            self._emit_pending = True
+            QTimer.singleShot(0, self, self._emit_range)
+
+    def _emit_range(self) -> None:
+        """Emit rangeChanged with the latest values of a coalesced drag."""
+        self._emit_pending = False
         self.rangeChanged.emit(self._min_val, self._max_val)
 
 
@@ -241,10 +309,39 @@ class AnimatedButton(QPushButton):
 
     Attributes
     ----------
-    style : str
-        The CSS style template for the button.
+    _STYLE_TEMPLATE : str
+        The CSS style template shared by all buttons.
+    _STYLE_CACHE : Dict[Tuple[int, str, str], str]
+        Formatted style sheets keyed by (height, color1, color2).
     """
 
+    _STYLE_TEMPLATE = """
+        QPushButton:!pressed {{
+            text-align: center;
+            font-family: "Roboto";
+            height: {h1};
+            border-radius: {r1};
+            background-color: rgb({color1});
+            color: white;
+            border: none;
+        }}
+        QPushButton:pressed {{
+            text-align: center;
+            font-family: "Roboto";
+            height: {h1};
+            border-radius: {r1};
+            background-color: rgb({color2});
+            color: white;
+            border: none;
+            border: 2px solid rgba(255,255,255,0)
+        }}
+        QPushButton:disabled {{
+            background-color: rgba({color1},80);
+            color: rgba(255,255,255,150);
+        }}
+        """
+    _STYLE_CACHE: Dict[Tuple[int, str, str], str] = {}
+
     def __init__(
         self,
         text: str,
@@ -267,40 +364,45 @@ class AnimatedButton(QPushButton):
             RGB string for pressed state background (default is "0,0,0").
         """
         super().__init__(text)
-        self.style = """
-            QPushButton:!pressed {{
-                text-align: center;
-                font-family: "Roboto";
-                height: {h1};
-                border-radius: {r1};
-                background-color: rgb({color1});
-                color: white;
-                border: none;
-            }}
-            QPushButton:pressed {{
-                text-align: center;
-                font-family: "Roboto";
-                height: {h1};
-                border-radius: {r1};
-                background-color: rgb({color2});
-                color: white;
-                border: none;
-                border: 2px solid rgba(255,255,255,0)
-            }}
-            QPushButton:disabled {{
-                background-color: rgba({color1},80);
-                color: rgba(255,255,255,150);
-            }}
-            """
-
-        # Try setting the height and width
         h = size[0]
-        self.setStyleSheet(
-            self.style.format(h1=h, r1=h // 2, color1=color1, color2=color2)
-        )
+        key = (h, color1, color2)
+        style = AnimatedButton._STYLE_CACHE.get(key)
+        if style is None:
+            style = AnimatedButton._STYLE_TEMPLATE.format(
+                h1=h, r1=h // 2, color1=color1, color2=color2
+            )
+            AnimatedButton._STYLE_CACHE[key] = style
+        self.setStyleSheet(style)
         self.setMinimumWidth(size[1])
 
 
+def use_opengl_viewport(view: QGraphicsView) -> bool:
+    """
+    Render a graphics view through an OpenGL viewport.
+
+    Replaces the view's viewport with a QOpenGLWidget so that scene items
+    are rasterized on the GPU, and switches to full viewport updates,
+    which is what an OpenGL viewport redraws anyway. Call this before
+    configuring the viewport, since the previous viewport is discarded.
+
+    Parameters
+    ----------
+    view : QGraphicsView
+        The view to switch over.
+
+    Returns
+    -------
+    bool
+        True if the OpenGL viewport was installed, False if QtOpenGLWidgets
+        is not available.
+    """
+    if not OPENGL_AVAILABLE:
+        return False
+    view.setViewport(QOpenGLWidget())
+    view.setViewportUpdateMode(QGraphicsView.FullViewportUpdate)
+    return True
+
+
 class PolygonPreviewItem(QGraphicsItem):
     """
     A QGraphicsItem for drawing polygon previews with dots at vertices.
@@ -338,7 +440,7 @@ class PolygonPreviewItem(QGraphicsItem):
         Parameters
         ----------
         points : Optional[List[QPointF]]
-            Initial polygon vertices (will be deep copied).
+            Initial polygon vertices (each QPointF is copied).
         color : Any, optional
             Color for the polygon (default is Qt.green).
         pen_w : float, optional
@@ -349,42 +451,90 @@ class PolygonPreviewItem(QGraphicsItem):
             Parent graphics item (default is None).
         """
         super().__init__(parent)
-        self.points = deepcopy(points) if points else []
+        self.points = [QPointF(p) for p in points] if points else []
         self.color = color
         self.pen_w = pen_w
         self.dot_size = dot_size
+        self._pen = QPen(color, pen_w)
+        self._brush = QBrush(color)
+        self._bounding_rect: Optional[QRectF] = None
+        self._qpolygon = QPolygonF(self.points)
+        self._dots_path = self._build_dots_path()
         self.setZValue(1)
+        # Re-rasterized only on set_points or a view transform change, not on pans
+        self.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+
+    def set_points(
+        self,
+        points: Optional[List[QPointF]],
+        pen_w: Optional[float] = None,
+        dot_size: Optional[float] = None,
+    ) -> None:
+        """
+        Replace the polygon vertices and optionally the pen and dot sizes.
+
+        Parameters
+        ----------
+        points : Optional[List[QPointF]]
+            New polygon vertices (each QPointF is copied).
+        pen_w : Optional[float], optional
+            New pen width; unchanged if None.
+        dot_size : Optional[float], optional
+            New vertex dot radius; unchanged if None.
+        """
+        self.prepareGeometryChange()
+        self.points = [QPointF(p) for p in points] if points else []
+        if pen_w is not None and pen_w != self.pen_w:
+            self.pen_w = pen_w
+            self._pen = QPen(self.color, pen_w)
+        if dot_size is not None:
+            self.dot_size = dot_size
+        self._bounding_rect = None
+        self._qpolygon = QPolygonF(self.points)
+        self._dots_path = self._build_dots_path()
+        self.update()
+
+    def _build_dots_path(self) -> QPainterPath:
+        """Return one path holding a dot ellipse for every vertex."""
+        path = QPainterPath()
+        path.setFillRule(Qt.WindingFill)
+        for pt in self.points:
+            path.addEllipse(pt, self.dot_size, self.dot_size)
+        return path
 
     def boundingRect(self) -> QRectF:
-        """Return the bounding rectangle of the polygon."""
+        """Return the bounding rectangle of the polygon (cached until set_points)."""
         if not self.points:
             return QRectF()
-        xs = [p.x() for p in self.points]
-        ys = [p.y() for p in self.points]
-        min_x, max_x = min(xs), max(xs)
-        min_y, max_y = min(ys), max(ys)
-        margin = max(6, self.dot_size + 2)
-        return QRectF(
-            min_x - margin,
-            min_y - margin,
-            (max_x - min_x) + 2 * margin,
-            (max_y - min_y) + 2 * margin,
-        )
+        if self._bounding_rect is None:
+            xy = np.fromiter(
+                (c for p in self.points for c in (p.x(), p.y())),
+                dtype=np.float64,
+                count=2 * len(self.points),
+            ).reshape(-1, 2)
+            min_x, min_y = xy.min(axis=0).tolist()
+            max_x, max_y = xy.max(axis=0).tolist()
+            margin = max(6, self.dot_size + 2)
+            self._bounding_rect = QRectF(
+                min_x - margin,
+                min_y - margin,
+                (max_x - min_x) + 2 * margin,
+                (max_y - min_y) + 2 * margin,
+            )
+        return QRectF(self._bounding_rect)
 
     def paint(self, painter: QPainter, option: Any, widget: Optional[QWidget]) -> None:
         """Paint the polygon outline and vertex dots."""
         if not self.points:
             return
-        pen = QPen(self.color, self.pen_w)
-        painter.setPen(pen)
+        painter.setPen(self._pen)
         painter.setRenderHint(QPainter.Antialiasing)
         if len(self.points) > 2:
-            painter.drawPolygon(QPolygonF(self.points))
+            painter.drawPolygon(self._qpolygon)
         elif len(self.points) > 1:
-            painter.drawPolyline(QPolygonF(self.points))
-        painter.setBrush(self.color)
-        for pt in self.points:
-            painter.drawEllipse(pt, self.dot_size, self.dot_size)
+            painter.drawPolyline(self._qpolygon)
+        painter.setBrush(self._brush)
+        painter.drawPath(self._dots_path)
 
 
 class ProgressDialog(QDialog):
@@ -476,48 +626,133 @@ class ClickableLabel(QLabel):
         super().mousePressEvent(event)
 
 
-class ClickableColorLabel(QLabel):
+def color_swatch_pixmap(
+    color: Any,
+    size: int,
+    border_color: QColor,
+    border_width: float,
+    radius: float,
+    dpr: float = 1.0,
+) -> QPixmap:
     """
-    A clickable color swatch widget for channel colors.
+    Return a square color swatch pixmap, shared through QPixmapCache.
 
-    Displays a small colored square that emits a clicked signal
-    when left-clicked, used for color picker dialogs.
+    Swatches are painted once per color, size, border and device pixel
+    ratio, so showing a color needs no style sheet parsing.
+
+    Parameters
+    ----------
+    color : Any
+        RGB color (any sequence of three 0-255 values).
+    size : int
+        Side length of the swatch in logical pixels.
+    border_color : QColor
+        Color of the outline.
+    border_width : float
+        Width of the outline in logical pixels.
+    radius : float
+        Corner radius in logical pixels.
+    dpr : float, optional
+        Device pixel ratio of the target widget (default is 1.0).
+
+    Returns
+    -------
+    QPixmap
+        The swatch, transparent outside its rounded corners.
+    """
+    r, g, b = (int(c) for c in color[:3])
+    key = (
+        f"cellpick-swatch-{r},{g},{b}-{size}-{border_color.rgba()}"
+        f"-{border_width}-{radius}@{dpr}"
+    )
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = QPixmap(round(size * dpr), round(size * dpr))
+        pixmap.setDevicePixelRatio(dpr)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(QPen(border_color, border_width))
+        painter.setBrush(QColor(r, g, b))
+        inset = border_width / 2
+        painter.drawRoundedRect(
+            QRectF(inset, inset, size - border_width, size - border_width),
+            radius,
+            radius,
+        )
+        painter.end()
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+
+# Events that tell a widget its device pixel ratio may have changed
+_DPR_CHANGE_EVENTS = tuple(
+    getattr(QEvent.Type, name)
+    for name in ("DevicePixelRatioChange", "ScreenChangeInternal")
+    if hasattr(QEvent.Type, name)
+)
+
+
+class ColorSwatchLabel(QLabel):
+    """
+    A label showing a color as a cached swatch pixmap.
+
+    Before a widget is shown it reports a device pixel ratio of 1.0, so the
+    swatch is painted at the primary screen's ratio first and repainted once
+    the label is shown or moves to a screen with a different ratio.
 
     Attributes
     ----------
-    clicked : Signal
-        Emitted when the label is left-clicked.
     color : Tuple[int, int, int]
         The current RGB color.
     """
 
-    clicked = Signal()
-
     def __init__(
-        self, color: Tuple[int, int, int], parent: Optional[QWidget] = None
+        self,
+        color: Tuple[int, int, int],
+        size: int,
+        border_color: QColor,
+        border_width: float,
+        radius: float,
+        parent: Optional[QWidget] = None,
     ) -> None:
         """
-        Initialize the ClickableColorLabel.
+        Initialize the ColorSwatchLabel.
 
         Parameters
         ----------
         color : Tuple[int, int, int]
             RGB color for the swatch.
+        size : int
+            Side length of the swatch in logical pixels.
+        border_color : QColor
+            Color of the outline.
+        border_width : float
+            Width of the outline in logical pixels.
+        radius : float
+            Corner radius in logical pixels.
         parent : Optional[QWidget], optional
             Parent widget (default is None).
         """
         super().__init__(parent)
         self.color = color
+        self._swatch_style = (size, border_color, border_width, radius)
+        self.setFixedSize(size, size)
         self.update_style()
-        self.setCursor(Qt.PointingHandCursor)
-        self.setFixedSize(20, 20)
+
+    def _device_pixel_ratio(self) -> float:
+        """Return the label's pixel ratio, or the primary screen's if unshown."""
+        if self.window().windowHandle() is not None:
+            return self.devicePixelRatioF()
+        screen = QGuiApplication.primaryScreen()
+        return screen.devicePixelRatio() if screen is not None else 1.0
 
     def update_style(self) -> None:
-        """Update the style sheet with the current color, rounded corners, and border."""
-        self.setStyleSheet(
-            f"background-color: rgb({self.color[0]}, {self.color[1]}, {self.color[2]}); "
-            f"border: 2px solid black; "
-            f"border-radius: 4px;"
+        """Show the current color as a cached swatch with rounded corners and border."""
+        self.setPixmap(
+            color_swatch_pixmap(
+                self.color, *self._swatch_style, self._device_pixel_ratio()
+            )
         )
 
     def set_color(self, color: Tuple[int, int, int]) -> None:
@@ -529,9 +764,60 @@ class ClickableColorLabel(QLabel):
         color : Tuple[int, int, int]
             New RGB color.
         """
+        if tuple(color) == tuple(self.color):
+            return
         self.color = color
         self.update_style()
 
+    def showEvent(self, event: QShowEvent) -> None:
+        """Repaint the swatch if it was painted for another pixel ratio."""
+        if self.pixmap().devicePixelRatio() != self.devicePixelRatioF():
+            self.update_style()
+        super().showEvent(event)
+
+    def event(self, event: QEvent) -> bool:
+        """Repaint the swatch when the label's screen or pixel ratio changes."""
+        if event.type() in _DPR_CHANGE_EVENTS:
+            self.update_style()
+        return super().event(event)
+
+
+class ClickableColorLabel(ColorSwatchLabel):
+    """
+    A clickable color swatch widget for channel colors.
+
+    Displays a small colored square that emits a clicked signal
+    when left-clicked, used for color picker dialogs.
+
+    Attributes
+    ----------
+    clicked : Signal
+        Emitted when the label is left-clicked.
+    color : Tuple[int, int, int]
+        The current RGB color.
+    SWATCH_SIZE : int
+        Side length of the swatch in pixels.
+    """
+
+    clicked = Signal()
+    SWATCH_SIZE = 20
+
+    def __init__(
+        self, color: Tuple[int, int, int], parent: Optional[QWidget] = None
+    ) -> None:
+        """
+        Initialize the ClickableColorLabel.
+
+        Parameters
+        ----------
+        color : Tuple[int, int, int]
+            RGB color for the swatch.
+        parent : Optional[QWidget], optional
+            Parent widget (default is None).
+        """
+        super().__init__(color, self.SWATCH_SIZE, QColor(Qt.black), 2, 4, parent)
+        self.setCursor(Qt.PointingHandCursor)
+
     def mousePressEvent(self, event: QMouseEvent) -> None:
         """Handle mouse press to emit clicked signal."""
         if event.button() == Qt.LeftButton:
@@ -583,15 +869,6 @@ class LoadLabelsDialog(QDialog):
         self.table_name = None
         self.column_name = None
 
-        from PySide6.QtWidgets import (
-            QRadioButton,
-            QButtonGroup,
-            QHBoxLayout,
-            QFileDialog,
-            QComboBox,
-            QGroupBox,
-        )
-
         layout = QVBoxLayout(self)
 
         # Source selection
@@ -622,34 +899,22 @@ class LoadLabelsDialog(QDialog):
 
         # SpatialData table selection
         sd_group = QGroupBox("SpatialData Table")
-        sd_layout = QVBoxLayout(sd_group)
+        sd_layout = QFormLayout(sd_group)
 
-        table_layout = QHBoxLayout()
-        table_layout.addWidget(QLabel("Table:"))
         self.table_combo = QComboBox()
         self.table_combo.currentTextChanged.connect(self.on_table_changed)
-        table_layout.addWidget(self.table_combo)
-
-        column_layout = QHBoxLayout()
-        column_layout.addWidget(QLabel("Column:"))
         self.column_combo = QComboBox()
-        column_layout.addWidget(self.column_combo)
-
-        id_layout = QHBoxLayout()
-        id_layout.addWidget(QLabel("ID Column:"))
         self.id_combo = QComboBox()
-        id_layout.addWidget(self.id_combo)
 
-        sd_layout.addLayout(table_layout)
-        sd_layout.addLayout(id_layout)
-        sd_layout.addLayout(column_layout)
+        sd_layout.addRow("Table:", self.table_combo)
+        sd_layout.addRow("ID Column:", self.id_combo)
+        sd_layout.addRow("Column:", self.column_combo)
 
-        # Populate SpatialData options if available
+        # SpatialData options are filled in the first time that source is chosen
+        self._sd_populated = False
+        self._categorical_columns: Dict[str, List[str]] = {}
         if self.spatial_data_loader:
-            tables = self.spatial_data_loader.get_available_tables()
-            self.table_combo.addItems(tables)
-            if tables:
-                self.on_table_changed(tables[0])
+            self.spatialdata_radio.toggled.connect(self._populate_sd)
         else:
             self.spatialdata_radio.setEnabled(False)
             sd_group.setEnabled(False)
@@ -679,16 +944,33 @@ class LoadLabelsDialog(QDialog):
         self.csv_radio.setChecked(True)
         sd_group.setEnabled(False)
 
+    def _populate_sd(self, checked: bool) -> None:
+        """
+        Fill the table, column and ID combos on first selection of SpatialData.
+
+        Parameters
+        ----------
+        checked : bool
+            Whether the SpatialData radio button is now checked.
+        """
+        if not checked or self._sd_populated:
+            return
+        self._sd_populated = True
+        tables = self.spatial_data_loader.get_available_tables()
+        self.table_combo.blockSignals(True)
+        self.table_combo.addItems(tables)
+        self.table_combo.blockSignals(False)
+        if tables:
+            self.on_table_changed(tables[0])
+
     def browse_csv(self) -> None:
         """Open file dialog to select CSV file."""
-        from PySide6.QtWidgets import QFileDialog
-
         file_path, _ = QFileDialog.getOpenFileName(
             self, "Select CSV File", "", "CSV Files (*.csv);;All Files (*)"
         )
         if file_path:
             self.csv_path = file_path
-            self.csv_path_label.setText(file_path.split("/")[-1])
+            self.csv_path_label.setText(os.path.basename(file_path))
 
     def on_table_changed(self, table_name: str) -> None:
         """
@@ -703,24 +985,32 @@ class LoadLabelsDialog(QDialog):
             return
 
         # Get categorical columns for this table (label candidates)
-        columns = self.spatial_data_loader.get_categorical_columns(table_name)
-        self.column_combo.clear()
-        self.column_combo.addItems(columns)
+        columns = self._categorical_columns.get(table_name)
+        if columns is None:
+            columns = self.spatial_data_loader.get_categorical_columns(table_name)
+            self._categorical_columns[table_name] = columns
 
         # Populate ID column candidates by scanning all obs columns for common id names
-        self.id_combo.clear()
         try:
             table = self.spatial_data_loader.sdata.tables[table_name]
-            obs_cols = list(table.obs.columns)
+            obs_names = table.obs.columns.astype(str)
         except Exception:
-            obs_cols = []
-
-        # Candidate id columns: those containing 'cell_id' or 'id'
-        id_candidates = [
-            c
-            for c in obs_cols
-            if "cell_id" in c.lower() or c.lower() == "id" or c.lower().endswith("_id")
-        ]
+            obs_names = None
+
+        id_candidates: List[str] = []
+        obs_cols: List[str] = []
+        default_choice = None
+        if obs_names is not None and len(obs_names):
+            obs_cols = obs_names.tolist()
+            # Candidate id columns: those containing 'cell_id' or 'id', matched in one pass
+            lower = obs_names.str.lower()
+            has_cell_id = lower.str.contains("cell_id", regex=False)
+            is_id = has_cell_id | (lower == "id") | lower.str.endswith("_id")
+            id_candidates = obs_names[is_id].tolist()
+            # Prefer a column that contains 'cell_id' as default if present
+            if has_cell_id.any():
+                default_choice = obs_names[has_cell_id][0]
+
         # Ensure 'index' is an option (uses row index)
         id_options = id_candidates.copy()
         if "index" not in id_options:
@@ -728,27 +1018,29 @@ class LoadLabelsDialog(QDialog):
 
         # If no candidates found, fall back to using 'index'
         if not id_candidates:
-            id_options = ["index"] + obs_cols[:]
+            id_options = ["index"] + obs_cols
 
-        self.id_combo.addItems(id_options)
+        default_idx = (
+            id_options.index(default_choice) if default_choice in id_options else 0
+        )
 
-        # Prefer a column that contains 'cell_id' as default if present
-        default_choice = None
-        for c in obs_cols:
-            if "cell_id" in c.lower():
-                default_choice = c
-                break
-        if default_choice:
-            idx = self.id_combo.findText(default_choice)
-            if idx >= 0:
-                self.id_combo.setCurrentIndex(idx)
+        # Refill both combos with signals blocked, then select the default once
+        self.column_combo.blockSignals(True)
+        self.id_combo.blockSignals(True)
+        try:
+            self.column_combo.clear()
+            self.column_combo.addItems(columns)
+            self.id_combo.clear()
+            self.id_combo.addItems(id_options)
+        finally:
+            self.column_combo.blockSignals(False)
+            self.id_combo.blockSignals(False)
+        self.id_combo.setCurrentIndex(default_idx)
 
     def accept(self) -> None:
         """Validate selections and accept the dialog."""
         if self.csv_radio.isChecked():
             if not self.csv_path:
-                from PySide6.QtWidgets import QMessageBox
-
                 QMessageBox.warning(
                     self, "No File Selected", "Please select a CSV file."
                 )
@@ -763,8 +1055,6 @@ class LoadLabelsDialog(QDialog):
             except Exception:
                 self.id_column = None
             if not self.table_name or not self.column_name:
-                from PySide6.QtWidgets import QMessageBox
-
                 QMessageBox.warning(
                     self, "Incomplete Selection", "Please select both table and column."
                 )
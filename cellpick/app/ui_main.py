@@ -1,16 +1,15 @@
+import importlib.util
 import math
 import os
 import re
 import sys
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import lxml.etree as etree
 import numpy as np
-from scipy import interpolate
 import pandas as pd
-from czifile import imread as cziimread
 from PySide6.QtCore import (
     QByteArray,
     QObject,
@@ -47,7 +46,6 @@ from PySide6.QtWidgets import (
     QInputDialog,
     QLabel,
     QListWidget,
-    QListWidgetItem,
     QMainWindow,
     QMenu,
     QMenuBar,
@@ -63,7 +61,6 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
-from tifffile import imread as tifimread
 
 from .components import (
     CHANNEL_COLORS,
@@ -78,6 +75,7 @@ from .ui_components import (
     AnimatedButton,
     ClickableColorLabel,
     ClickableLabel,
+    ColorSwatchLabel,
     ProgressDialog,
 )
 from .utils import (
@@ -88,32 +86,235 @@ from .utils import (
     export_landmarks_xml,
     export_ar_xml,
 )
-from .spatialdata_io import (
-    SpatialDataLoader,
-    SpatialDataExporter,
-    SPATIALDATA_AVAILABLE,
+
+# Outline of the label color indicators in the action page
+_SWATCH_BORDER = QColor("#666666")
+
+# Element types CellPick displays or reads labels from; points (e.g. transcript
+# tables) are never used, so they are not read when a store is opened
+_SPATIALDATA_ELEMENTS = ("images", "labels", "shapes", "tables")
+
+# spatialdata_io pulls in spatialdata, dask and zarr, so it is imported on first
+# use; this probe only checks that its dependencies are installed
+_SPATIALDATA_INSTALLED = all(
+    importlib.util.find_spec(name) is not None
+    for name in ("spatialdata", "dask", "zarr", "xarray", "skimage", "geopandas")
 )
 
 if sys.platform == "darwin":
     try:
-        import tempfile
-
         from AppKit import NSApplication, NSImage
+        from Foundation import NSData
 
         current_dir = Path(__file__).parent.parent
         logo_path = current_dir / "assets" / "logo.png"
         with open(logo_path, "rb") as f:
-            tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".png")
-            tmp.write(f.read())
-            tmp.close()
-            icon_path = tmp.name
+            png_bytes = f.read()
+        # Build the dock icon straight from the PNG bytes, no temporary file
+        png_data = NSData.dataWithBytes_length_(png_bytes, len(png_bytes))
         appkit_app = NSApplication.sharedApplication()
-        appkit_app.setApplicationIconImage_(
-            NSImage.alloc().initWithContentsOfFile_(icon_path)
-        )
+        appkit_app.setApplicationIconImage_(NSImage.alloc().initWithData_(png_data))
     except ImportError:
         print("PyObjC is not installed. Dock icon will not be set.")
 
+# Menu bar layout: (menu, entries) with entries (text, attribute, slot, shortcut,
+# checked). None entries are separators, slot is a dotted MainWindow attribute
+# path or a (path, *args) tuple, and checked is None for non-checkable actions.
+_MENU_SPEC = [
+    (
+        "File",
+        [
+            (
+                "Add Spatial Data",
+                "action_add_spatialdata",
+                "add_spatialdata",
+                None,
+                None,
+            ),
+            ("Add Channel", "action_add_channel", "add_channel", None, None),
+            ("Load Shapes", "action_load_shapes", "load_shapes", None, None),
+            ("Load Labels", "action_load_labels", "load_labels", None, None),
+            None,
+            (
+                "Export Selected Shapes",
+                "action_export",
+                "export_selected_shapes",
+                None,
+                None,
+            ),
+            (
+                "Export to SpatialData",
+                "action_export_spatialdata",
+                "export_to_spatialdata",
+                None,
+                None,
+            ),
+            None,
+            (
+                "Save Screenshot...",
+                "action_screenshot",
+                "save_screenshot",
+                "Ctrl+Shift+S",
+                None,
+            ),
+            None,
+            ("Exit", None, "close", None, None),
+        ],
+    ),
+    (
+        "View",
+        [
+            ("Refresh", "action_refresh", "image_viewer.update_display", None, None),
+            ("Reset View", "action_reset_view", "reset_view", None, None),
+            None,
+            (
+                "Show Shapes",
+                "action_toggle_shapes",
+                "toggle_shapes_visibility",
+                "Ctrl+Shift+L",
+                True,
+            ),
+            (
+                "Show Gradient (instead of Labels)",
+                "action_toggle_color_mode",
+                "toggle_color_mode",
+                "Ctrl+Shift+G",
+                False,
+            ),
+            (
+                "Abstract View",
+                "action_toggle_abstract_view",
+                "toggle_abstract_view",
+                "Ctrl+Shift+U",
+                False,
+            ),
+            None,
+            ("Next Page", "action_next", "goto_second_page", None, None),
+        ],
+    ),
+    (
+        "Calibration",
+        [
+            (
+                "Load Calibration File",
+                "action_load_calibration",
+                "load_calibration",
+                None,
+                None,
+            ),
+            (
+                "Manual Calibration",
+                "action_manual_calibration",
+                "manual_calibration",
+                None,
+                None,
+            ),
+            (
+                "Confirm Calibration",
+                "action_confirm_calibration",
+                "confirm_calibration",
+                None,
+                None,
+            ),
+        ],
+    ),
+    (
+        "Landmarks",
+        [
+            (
+                "Add Landmark",
+                "action_add_landmark",
+                "toggle_landmark_selection",
+                None,
+                None,
+            ),
+            (
+                "Confirm Landmark",
+                "action_confirm_landmark",
+                "confirm_landmark",
+                None,
+                None,
+            ),
+            (
+                "Delete Landmark",
+                "action_delete_landmark",
+                "toggle_landmark_deletion",
+                None,
+                None,
+            ),
+            (
+                "Delete Last Point",
+                "action_delete_last_lnd_point",
+                "delete_last_lnd_point",
+                None,
+                None,
+            ),
+            None,
+            (
+                "Load Landmarks from File",
+                "action_load_landmarks",
+                "load_landmarks_from_file",
+                None,
+                None,
+            ),
+        ],
+    ),
+    (
+        "Active Regions",
+        [
+            ("Add Active Region", "action_add_ar", "toggle_ar_selection", None, None),
+            ("Confirm Active Region", "action_confirm_ar", "confirm_ar", None, None),
+            (
+                "Delete Active Region",
+                "action_delete_ar",
+                "toggle_ar_deletion",
+                None,
+                None,
+            ),
+            (
+                "Delete Last Point",
+                "action_delete_last_ar_point",
+                "delete_last_ar_point",
+                None,
+                None,
+            ),
+            None,
+            (
+                "Load Active Regions from File",
+                "action_load_ar",
+                "load_ar_from_file",
+                None,
+                None,
+            ),
+        ],
+    ),
+    (
+        "Shapes",
+        [
+            ("Select Shapes", "action_select_shapes", "select_shapes", None, None),
+            ("Add Shapes", "action_add_shapes", "toggle_shape_add", None, None),
+            ("Remove Shapes", "action_rem_shapes", "toggle_shape_rem", None, None),
+        ],
+    ),
+    (
+        "Help",
+        [
+            ("Search...", None, "_show_search_dialog", "Ctrl+F", None),
+            None,
+            ("Visit Website", None, ("_open_url", "https://cellpick.app"), None, None),
+            (
+                "Documentation",
+                None,
+                ("_open_url", "https://cellpick.readthedocs.io/en/latest/"),
+                None,
+                None,
+            ),
+            None,
+            ("About CellPick", None, "_show_about_dialog", None, None),
+        ],
+    ),
+]
+
 
 class ScrollableContainer(QWidget):
     """
@@ -217,18 +418,20 @@ class ResolutionSelectionDialog(QDialog):
         self.list_widget = QListWidget()
         self.list_widget.setAlternatingRowColors(True)
 
+        texts = []
         for info in level_info:
             # Format: "Level 0: 40000 × 30000 (3 channels) - Full resolution"
             dims = f"{info['width']:,} × {info['height']:,}"
             channels = (
                 f"{info['channels']} channel{'s' if info['channels'] != 1 else ''}"
             )
-            text = (
+            texts.append(
                 f"Level {info['level']}: {dims} ({channels}) - {info['scale_factor']}"
             )
-            item = QListWidgetItem(text)
-            item.setData(Qt.UserRole, info["level"])
-            self.list_widget.addItem(item)
+        # Insert all rows at once, then attach each level number
+        self.list_widget.addItems(texts)
+        for row, info in enumerate(level_info):
+            self.list_widget.item(row).setData(Qt.UserRole, info["level"])
 
         # Select the first item by default
         if self.list_widget.count() > 0:
@@ -288,6 +491,8 @@ class SelectionPage(QWidget):
         Checkbox for auto-adjusting saturation.
     next_btn : AnimatedButton
         Button to proceed to the next page.
+    main_window : Optional[MainWindow]
+        The window owning this page, whose shape outline color is edited.
     """
 
     channel_control_panel: ScrollableContainer
@@ -300,10 +505,13 @@ class SelectionPage(QWidget):
     reset_btn: AnimatedButton
     next_btn: AnimatedButton
     buttons: List[Any]
+    main_window: Optional["MainWindow"]
 
     def __init__(self) -> None:
         """Initialize the SelectionPage with all UI controls."""
         super().__init__()
+        # Set by the owning MainWindow
+        self.main_window: Optional["MainWindow"] = None
         layout = QVBoxLayout(self)
         self.channel_control_panel = ScrollableContainer(height=120)
         button_panel1 = QGroupBox("Load Data")
@@ -359,24 +567,33 @@ class SelectionPage(QWidget):
         layout.addWidget(self.reset_btn)
         layout.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
         layout.addWidget(self.next_btn)
-        self.buttons = self.findChildren(AnimatedButton)
+        self.buttons = [
+            self.add_spatialdata_btn,
+            self.add_channel_btn,
+            self.load_shapes_btn,
+            self.load_labels_btn,
+            self.load_calibration_btn,
+            self.manual_calibration_btn,
+            self.confirm_calibration_btn,
+            self.select_shape_color_btn,
+            self.refresh_btn,
+            self.reset_btn,
+            self.next_btn,
+        ]
         self.select_shape_color_btn.clicked.connect(self.pick_shape_color)
 
     def pick_shape_color(self) -> None:
         """Open a color dialog to select the shape outline color."""
-        # Robustly find the MainWindow and use its shape_outline_color
-        main_window = self.parent()
-        while main_window and not hasattr(main_window, "shape_outline_color"):
-            main_window = main_window.parent()
-        if main_window and hasattr(main_window, "shape_outline_color"):
-            color = QColorDialog.getColor(
-                main_window.shape_outline_color, self, "Select shape outline color"
-            )
-            if color.isValid():
-                main_window.shape_outline_color = color
-            # Repaint shapes with the selected color
-            if hasattr(main_window, "image_viewer"):
-                main_window.image_viewer.update_polygon_display()
+        main_window = self.main_window
+        if main_window is None:
+            return
+        color = QColorDialog.getColor(
+            main_window.shape_outline_color, self, "Select shape outline color"
+        )
+        if color.isValid():
+            main_window.shape_outline_color = color
+        # Repaint shapes with the selected color
+        main_window.image_viewer.update_polygon_display()
 
 
 class ActionPage(QWidget):
@@ -460,6 +677,7 @@ class ActionPage(QWidget):
             ["Select k over union of regions", "Random", "Select k per region"]
         )
         self.label_checkboxes = {}
+        self._label_rows: Dict[Any, Tuple[QWidget, QCheckBox, ColorSwatchLabel]] = {}
         # Container for label checkboxes (initially hidden)
         # self.label_checkboxes_container = QWidget()
         # self.label_checkboxes_layout = QVBoxLayout(self.label_checkboxes_container)
@@ -529,7 +747,26 @@ class ActionPage(QWidget):
 
         layout.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding))
         layout.addWidget(self.back_btn)
-        self.buttons = self.findChildren(AnimatedButton)
+        # cancel_lnd_btn is not placed in the page and is left out
+        self.buttons = [
+            self.back_btn,
+            self.add_lnd_btn,
+            self.delete_last_point_lnd_btn,
+            self.confirm_lnd_btn,
+            self.delete_lnd_btn,
+            self.add_ar_btn,
+            self.delete_last_point_ar_btn,
+            self.confirm_ar_btn,
+            self.delete_ar_btn,
+            self.select_shapes_btn,
+            self.add_shapes_btn,
+            self.rem_shapes_btn,
+            self.export_btn,
+            self.export_spatialdata_btn,
+            self.load_lnd_btn,
+            self.load_ar_btn,
+            self.k_box,
+        ]
 
     def update_label_checkboxes(self, labels: dict) -> None:
         """
@@ -540,16 +777,33 @@ class ActionPage(QWidget):
         labels : dict
             Dictionary mapping label values to RGB colors (RGB 0-255 tuples)
         """
-        # Clear existing checkboxes
-        for checkbox in self.label_checkboxes.values():
-            checkbox.deleteLater()
-        self.label_checkboxes.clear()
-
-        # Clear layout items (but skip stretch items which don't have widgets)
-        while self.label_checkboxes_layout.count() > 1:  # Keep the stretch
-            item = self.label_checkboxes_layout.takeAt(0)
-            if item and item.widget():
-                item.widget().deleteLater()
+        new_labels = {} if labels is None else labels
+
+        # Rows are diffed against the current ones: only removed labels are
+        # deleted, only added labels get new widgets
+        self.label_checkboxes_container.setUpdatesEnabled(False)
+        try:
+            for label in [old for old in self._label_rows if old not in new_labels]:
+                container, _, _ = self._label_rows.pop(label)
+                self.label_checkboxes_layout.removeWidget(container)
+                container.deleteLater()
+
+            self.label_checkboxes = {}
+            # Kept rows are already in sorted order, so each new row is inserted
+            # at its final position
+            for position, label in enumerate(sorted(new_labels.keys())):
+                rgb = tuple(int(c) for c in new_labels[label][:3])
+                row = self._label_rows.get(label)
+                if row is None:
+                    row = self._make_label_row(label, rgb)
+                    self._label_rows[label] = row
+                    self.label_checkboxes_layout.insertWidget(position, row[0])
+                # Kept rows keep the user's selection, only the color follows
+                _, checkbox, color_label = row
+                color_label.set_color(rgb)
+                self.label_checkboxes[label] = checkbox
+        finally:
+            self.label_checkboxes_container.setUpdatesEnabled(True)
 
         if labels is None:
             # Remove "Select k per label" option if present (count > 3)
@@ -557,38 +811,44 @@ class ActionPage(QWidget):
                 self.clustering_type.removeItem(3)
             return
 
-        # Create new checkboxes for each label with color indicator
-        for label in sorted(labels.keys()):
-            # Create a container widget for checkbox + color indicator
-            container = QWidget()
-            h_layout = QHBoxLayout(container)
-            h_layout.setContentsMargins(0, 0, 0, 0)
-            h_layout.setSpacing(6)
-
-            checkbox = QCheckBox(str(label))
-            checkbox.setChecked(True)  # All selected by default
-
-            # Create color indicator (small colored square)
-            color_label = QLabel()
-            color_label.setFixedSize(16, 16)
-            rgb = labels[label]
-            color_label.setStyleSheet(
-                f"background-color: rgb({int(rgb[0])}, {int(rgb[1])}, {int(rgb[2])}); "
-                f"border: 1px solid #666; border-radius: 2px;"
-            )
-
-            h_layout.addWidget(color_label)
-            h_layout.addWidget(checkbox)
-            h_layout.addStretch()
-
-            self.label_checkboxes[label] = checkbox
-            # Use the container's addWidget to insert before stretch
-            self.label_checkboxes_container.addWidget(container)
-
         # Add "Select k per label" option to clustering type if not already present
         if self.clustering_type.count() == 3:
             self.clustering_type.addItem("Select k per label")
 
+    def _make_label_row(
+        self, label: Any, rgb: Tuple[int, int, int]
+    ) -> Tuple[QWidget, QCheckBox, ColorSwatchLabel]:
+        """
+        Create the checkbox row for one label with its color indicator.
+
+        Parameters
+        ----------
+        label : Any
+            The label value shown next to the checkbox.
+        rgb : Tuple[int, int, int]
+            Initial color of the indicator.
+
+        Returns
+        -------
+        Tuple[QWidget, QCheckBox, ColorSwatchLabel]
+            The row container, its checkbox and its color indicator.
+        """
+        container = QWidget()
+        h_layout = QHBoxLayout(container)
+        h_layout.setContentsMargins(0, 0, 0, 0)
+        h_layout.setSpacing(6)
+
+        checkbox = QCheckBox(str(label))
+        checkbox.setChecked(True)  # New labels are selected by default
+
+        # Create color indicator (small colored square)
+        color_label = ColorSwatchLabel(rgb, 16, _SWATCH_BORDER, 1, 2)
+
+        h_layout.addWidget(color_label)
+        h_layout.addWidget(checkbox)
+        h_layout.addStretch()
+        return container, checkbox, color_label
+
     def get_selected_labels(self) -> Optional[List[Any]]:
         """
         Get list of selected labels from checkboxes.
@@ -619,7 +879,6 @@ class ActionPage(QWidget):
             self.label_checkboxes_container.show()
         else:
             self.label_checkboxes_container.hide()
-        self.buttons.append(self.k_box)
 
 
 class MainWindow(QMainWindow):
@@ -704,6 +963,7 @@ class MainWindow(QMainWindow):
         main_layout = QHBoxLayout(central_widget)
         self.stack = QStackedWidget()
         self.page1 = SelectionPage()
+        self.page1.main_window = self
         self.page2 = ActionPage()
         self.stack.addWidget(self.page1)
         self.stack.addWidget(self.page2)
@@ -713,11 +973,7 @@ class MainWindow(QMainWindow):
         self.logo = QWidget()
         self.scale = 1.0
         hcenter_layout = QHBoxLayout(self.logo)
-        # Import SVG logo
-        current_dir = Path(__file__).parent.parent
-        logo_svg_path = current_dir / "assets" / "logo.svg"
-        with open(logo_svg_path, "rb") as f:
-            svg_bytes = f.read()
+        # Reuse the SVG logo bytes read for the window icon
         svg_widget = QSvgWidget()
         svg_widget.load(svg_bytes)
         svg_widget.setFixedSize(400, 400)
@@ -774,193 +1030,51 @@ class MainWindow(QMainWindow):
     def _init_menu_bar(self) -> None:
         """Initialize menu bar with actions mirroring all GUI buttons."""
         menu_bar = self.menuBar()
+        for menu_name, entries in _MENU_SPEC:
+            menu = menu_bar.addMenu(menu_name)
+            for entry in entries:
+                if entry is None:
+                    menu.addSeparator()
+                    continue
+                text, attr, slot, shortcut, checked = entry
+                action = QAction(text, self)
+                if checked is not None:
+                    action.setCheckable(True)
+                    action.setChecked(checked)
+                if shortcut:
+                    action.setShortcut(shortcut)
+                action.triggered.connect(self._menu_slot(slot))
+                menu.addAction(action)
+                if attr:
+                    setattr(self, attr, action)
+
+        # Disabled until both labels and landmarks are available
+        self.action_toggle_color_mode.setEnabled(False)
+
+    def _menu_slot(self, slot: Any) -> Any:
+        """
+        Resolve a _MENU_SPEC slot to a callable.
 
-        # --- File Menu ---
-        file_menu = menu_bar.addMenu("File")
-        self.action_add_spatialdata = QAction("Add Spatial Data", self)
-        self.action_add_spatialdata.triggered.connect(self.add_spatialdata)
-        file_menu.addAction(self.action_add_spatialdata)
-
-        self.action_add_channel = QAction("Add Channel", self)
-        self.action_add_channel.triggered.connect(self.add_channel)
-        file_menu.addAction(self.action_add_channel)
-
-        self.action_load_shapes = QAction("Load Shapes", self)
-        self.action_load_shapes.triggered.connect(self.load_shapes)
-        file_menu.addAction(self.action_load_shapes)
-
-        self.action_load_labels = QAction("Load Labels", self)
-        self.action_load_labels.triggered.connect(self.load_labels)
-        file_menu.addAction(self.action_load_labels)
-
-        file_menu.addSeparator()
-
-        self.action_export = QAction("Export Selected Shapes", self)
-        self.action_export.triggered.connect(self.export_selected_shapes)
-        file_menu.addAction(self.action_export)
-
-        self.action_export_spatialdata = QAction("Export to SpatialData", self)
-        self.action_export_spatialdata.triggered.connect(self.export_to_spatialdata)
-        file_menu.addAction(self.action_export_spatialdata)
-
-        file_menu.addSeparator()
-
-        self.action_screenshot = QAction("Save Screenshot...", self)
-        self.action_screenshot.setShortcut("Ctrl+Shift+S")
-        self.action_screenshot.triggered.connect(self.save_screenshot)
-        file_menu.addAction(self.action_screenshot)
-
-        file_menu.addSeparator()
-
-        action_exit = QAction("Exit", self)
-        action_exit.triggered.connect(self.close)
-        file_menu.addAction(action_exit)
-
-        # --- View Menu ---
-        view_menu = menu_bar.addMenu("View")
-        self.action_refresh = QAction("Refresh", self)
-        self.action_refresh.triggered.connect(self.image_viewer.update_display)
-        view_menu.addAction(self.action_refresh)
-
-        self.action_reset_view = QAction("Reset View", self)
-        self.action_reset_view.triggered.connect(self.reset_view)
-        view_menu.addAction(self.action_reset_view)
-
-        view_menu.addSeparator()
-
-        self.action_toggle_shapes = QAction("Show Shapes", self)
-        self.action_toggle_shapes.setCheckable(True)
-        self.action_toggle_shapes.setChecked(True)
-        self.action_toggle_shapes.setShortcut("Ctrl+Shift+L")
-        self.action_toggle_shapes.triggered.connect(self.toggle_shapes_visibility)
-        view_menu.addAction(self.action_toggle_shapes)
-
-        self.action_toggle_color_mode = QAction(
-            "Show Gradient (instead of Labels)", self
-        )
-        self.action_toggle_color_mode.setCheckable(True)
-        self.action_toggle_color_mode.setChecked(False)
-        self.action_toggle_color_mode.setShortcut("Ctrl+Shift+G")
-        self.action_toggle_color_mode.triggered.connect(self.toggle_color_mode)
-        self.action_toggle_color_mode.setEnabled(
-            False
-        )  # Disabled until both labels and landmarks are available
-        view_menu.addAction(self.action_toggle_color_mode)
-
-        self.action_toggle_abstract_view = QAction("Abstract View", self)
-        self.action_toggle_abstract_view.setCheckable(True)
-        self.action_toggle_abstract_view.setChecked(False)
-        self.action_toggle_abstract_view.setShortcut("Ctrl+Shift+U")
-        self.action_toggle_abstract_view.triggered.connect(self.toggle_abstract_view)
-        view_menu.addAction(self.action_toggle_abstract_view)
-
-        view_menu.addSeparator()
-
-        self.action_next = QAction("Next Page", self)
-        self.action_next.triggered.connect(self.goto_second_page)
-        view_menu.addAction(self.action_next)
-
-        # --- Calibration Menu ---
-        calibration_menu = menu_bar.addMenu("Calibration")
-        self.action_load_calibration = QAction("Load Calibration File", self)
-        self.action_load_calibration.triggered.connect(self.load_calibration)
-        calibration_menu.addAction(self.action_load_calibration)
-
-        self.action_manual_calibration = QAction("Manual Calibration", self)
-        self.action_manual_calibration.triggered.connect(self.manual_calibration)
-        calibration_menu.addAction(self.action_manual_calibration)
-
-        self.action_confirm_calibration = QAction("Confirm Calibration", self)
-        self.action_confirm_calibration.triggered.connect(self.confirm_calibration)
-        calibration_menu.addAction(self.action_confirm_calibration)
-
-        # --- Landmarks Menu ---
-        landmarks_menu = menu_bar.addMenu("Landmarks")
-        self.action_add_landmark = QAction("Add Landmark", self)
-        self.action_add_landmark.triggered.connect(self.toggle_landmark_selection)
-        landmarks_menu.addAction(self.action_add_landmark)
-
-        self.action_confirm_landmark = QAction("Confirm Landmark", self)
-        self.action_confirm_landmark.triggered.connect(self.confirm_landmark)
-        landmarks_menu.addAction(self.action_confirm_landmark)
-
-        self.action_delete_landmark = QAction("Delete Landmark", self)
-        self.action_delete_landmark.triggered.connect(self.toggle_landmark_deletion)
-        landmarks_menu.addAction(self.action_delete_landmark)
-
-        self.action_delete_last_lnd_point = QAction("Delete Last Point", self)
-        self.action_delete_last_lnd_point.triggered.connect(self.delete_last_lnd_point)
-        landmarks_menu.addAction(self.action_delete_last_lnd_point)
-
-        landmarks_menu.addSeparator()
-
-        self.action_load_landmarks = QAction("Load Landmarks from File", self)
-        self.action_load_landmarks.triggered.connect(self.load_landmarks_from_file)
-        landmarks_menu.addAction(self.action_load_landmarks)
-
-        # --- Active Regions Menu ---
-        ar_menu = menu_bar.addMenu("Active Regions")
-        self.action_add_ar = QAction("Add Active Region", self)
-        self.action_add_ar.triggered.connect(self.toggle_ar_selection)
-        ar_menu.addAction(self.action_add_ar)
-
-        self.action_confirm_ar = QAction("Confirm Active Region", self)
-        self.action_confirm_ar.triggered.connect(self.confirm_ar)
-        ar_menu.addAction(self.action_confirm_ar)
-
-        self.action_delete_ar = QAction("Delete Active Region", self)
-        self.action_delete_ar.triggered.connect(self.toggle_ar_deletion)
-        ar_menu.addAction(self.action_delete_ar)
-
-        self.action_delete_last_ar_point = QAction("Delete Last Point", self)
-        self.action_delete_last_ar_point.triggered.connect(self.delete_last_ar_point)
-        ar_menu.addAction(self.action_delete_last_ar_point)
-
-        ar_menu.addSeparator()
-
-        self.action_load_ar = QAction("Load Active Regions from File", self)
-        self.action_load_ar.triggered.connect(self.load_ar_from_file)
-        ar_menu.addAction(self.action_load_ar)
-
-        # --- Shapes Menu ---
-        shapes_menu = menu_bar.addMenu("Shapes")
-        self.action_select_shapes = QAction("Select Shapes", self)
-        self.action_select_shapes.triggered.connect(self.select_shapes)
-        shapes_menu.addAction(self.action_select_shapes)
-
-        self.action_add_shapes = QAction("Add Shapes", self)
-        self.action_add_shapes.triggered.connect(self.toggle_shape_add)
-        shapes_menu.addAction(self.action_add_shapes)
-
-        self.action_rem_shapes = QAction("Remove Shapes", self)
-        self.action_rem_shapes.triggered.connect(self.toggle_shape_rem)
-        shapes_menu.addAction(self.action_rem_shapes)
-
-        # --- Help Menu ---
-        help_menu = menu_bar.addMenu("Help")
-
-        action_search = QAction("Search...", self)
-        action_search.setShortcut("Ctrl+F")
-        action_search.triggered.connect(self._show_search_dialog)
-        help_menu.addAction(action_search)
-
-        help_menu.addSeparator()
-
-        action_website = QAction("Visit Website", self)
-        action_website.triggered.connect(lambda: self._open_url("https://cellpick.app"))
-        help_menu.addAction(action_website)
-
-        action_docs = QAction("Documentation", self)
-        action_docs.triggered.connect(
-            lambda: self._open_url("https://cellpick.readthedocs.io/en/latest/")
-        )
-        help_menu.addAction(action_docs)
-
-        help_menu.addSeparator()
+        Parameters
+        ----------
+        slot : Any
+            Dotted attribute path on the window, or a (path, *args) tuple
+            whose callable is invoked with the given arguments.
 
-        action_about = QAction("About CellPick", self)
-        action_about.triggered.connect(self._show_about_dialog)
-        help_menu.addAction(action_about)
+        Returns
+        -------
+        Any
+            The callable to connect to the action's triggered signal.
+        """
+        args = ()
+        if isinstance(slot, tuple):
+            slot, *args = slot
+        target = self
+        for name in slot.split("."):
+            target = getattr(target, name)
+        if args:
+            return lambda: target(*args)
+        return target
 
     def _open_url(self, url: str) -> None:
         """Open a URL in the default web browser."""
@@ -1399,8 +1513,12 @@ class MainWindow(QMainWindow):
         )
         if file_path:
             if file_path[-3:] == "czi":
+                from czifile import imread as cziimread
+
                 image_data = cziimread(file_path).squeeze()
             else:
+                from tifffile import imread as tifimread
+
                 image_data = tifimread(file_path).squeeze()
 
             if len(image_data.shape) not in [2, 3]:
@@ -1517,6 +1635,8 @@ class MainWindow(QMainWindow):
 
     def add_spatialdata(self) -> None:
         """Load data from a SpatialData .zarr store."""
+        from .spatialdata_io import SpatialDataLoader, SPATIALDATA_AVAILABLE
+
         # Check if we're already in IMAGE mode
         if self.state.data_load_mode == DataLoadMode.IMAGE:
             QMessageBox.warning(
@@ -1571,7 +1691,7 @@ class MainWindow(QMainWindow):
             progress.setValue(10)
             QApplication.processEvents()
 
-            loader = SpatialDataLoader(zarr_path)
+            loader = SpatialDataLoader(zarr_path, selection=_SPATIALDATA_ELEMENTS)
             # Store the loader for later use (e.g., loading labels)
             self.spatial_data_loader = loader
             progress.setValue(20)
@@ -1843,7 +1963,13 @@ class MainWindow(QMainWindow):
                     all_polygons = [
                         (poly.points, poly.label) for poly in self.state.shapes
                     ]
-                    selected_ids = loader.load_cellpick_selected_cells(all_polygons)
+                    centroids = loader.cell_centroids
+                    scale_factor = self._spatialdata_scale_factor
+                    if centroids is not None and scale_factor > 1:
+                        centroids = centroids / scale_factor
+                    selected_ids = loader.load_cellpick_selected_cells(
+                        all_polygons, centroids=centroids
+                    )
                     if selected_ids:
                         self.state.selected_shape_ids = selected_ids
                         annotations_loaded.append(
@@ -2186,6 +2312,8 @@ class MainWindow(QMainWindow):
             # Load the image based on file type
             file_ext = Path(file_path).suffix.lower()
             if file_ext in (".tif", ".tiff"):
+                from tifffile import imread as tifimread
+
                 label_array = tifimread(file_path)
             else:
                 # Use PIL for PNG and other formats
@@ -2355,6 +2483,8 @@ class MainWindow(QMainWindow):
             self.load_shapes_and_manual_calibrate()
 
     def load_shapes_and_manual_calibrate(self) -> None:
+        from scipy import interpolate
+
         xml_path = self.xml_path
 
         try:
@@ -2517,7 +2647,8 @@ class MainWindow(QMainWindow):
                 return
         elif dialog.selected_source == "spatialdata":
             if spatial_data_loader:
-                labels_dict = spatial_data_loader.get_cell_labels(
+                # Dense per-ID array when the IDs are compact, dict otherwise
+                labels_dict = spatial_data_loader.get_cell_label_mapping(
                     dialog.column_name,
                     dialog.table_name,
                     instance_column=getattr(dialog, "id_column", None),
@@ -2538,7 +2669,13 @@ class MainWindow(QMainWindow):
             delete_labels = True
 
         # Load labels into state
-        if labels_dict:
+        if labels_dict is None:
+            n_loaded = 0
+        elif isinstance(labels_dict, dict):
+            n_loaded = len(labels_dict)
+        else:
+            n_loaded = np.count_nonzero(labels_dict != None)  # noqa: E711
+        if n_loaded:
             self.state.load_cell_labels(labels_dict)
             # Update label checkboxes in UI
             self.page2.update_label_checkboxes(self.state.label_colors)
@@ -2546,7 +2683,7 @@ class MainWindow(QMainWindow):
             QMessageBox.information(
                 self,
                 "Success",
-                f"Loaded labels for {len(labels_dict)} cells.",
+                f"Loaded labels for {n_loaded} cells.",
             )
 
         if delete_labels:
@@ -2595,7 +2732,7 @@ class MainWindow(QMainWindow):
             self.page2.add_lnd_btn.setEnabled(True)
         if self.state.selected_shape_ids:
             self.page2.export_btn.setEnabled(True)
-            if SPATIALDATA_AVAILABLE:
+            if _SPATIALDATA_INSTALLED:
                 self.page2.export_spatialdata_btn.setEnabled(True)
         if self.state.can_load_ar():
             self.page2.load_ar_btn.setEnabled(True)
@@ -2779,6 +2916,8 @@ class MainWindow(QMainWindow):
         """
         Export CellPick annotations to SpatialData format.
         """
+        from .spatialdata_io import SpatialDataExporter, SPATIALDATA_AVAILABLE
+
         if not SPATIALDATA_AVAILABLE:
             QMessageBox.critical(
                 self,
@@ -2891,9 +3030,18 @@ class MainWindow(QMainWindow):
                     for pts in points_list
                 ]
 
-            # Rescale data for export
+            # Rescale data for export; selected cells reuse the rescaled
+            # objects of all_polygons so the exporter rasterizes them once
+            export_all_polygons = (
+                [rescale_polygon(p) for p in all_polygons] if all_polygons else None
+            )
+            rescaled = (
+                {id(p): q for p, q in zip(all_polygons, export_all_polygons)}
+                if all_polygons
+                else {}
+            )
             export_selected_polygons = (
-                [rescale_polygon(p) for p in selected_polygons]
+                [rescaled.get(id(p)) or rescale_polygon(p) for p in selected_polygons]
                 if selected_polygons
                 else []
             )
@@ -2903,9 +3051,6 @@ class MainWindow(QMainWindow):
             export_active_regions = (
                 rescale_points(self.state.active_regions) if has_ar else None
             )
-            export_all_polygons = (
-                [rescale_polygon(p) for p in all_polygons] if all_polygons else None
-            )
 
             # Scale image_shape to full resolution to match scaled coordinates
             export_image_shape = image_shape
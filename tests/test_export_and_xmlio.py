@@ -72,9 +72,27 @@ def test_dvpxml_parses_minimal_input(tmp_path: Path) -> None:
 
     dvp = DVPXML(str(xml_path))
     assert dvp.n_shapes == 1
-    assert dvp.x_calibration == [10, 30, 50]
-    assert dvp.y_calibration == [20, 40, 60]
+    np.testing.assert_array_equal(dvp.x_calibration, np.array([10, 30, 50]))
+    np.testing.assert_array_equal(dvp.y_calibration, np.array([20, 40, 60]))
+    assert dvp.x_calibration.dtype == np.int32
 
     x, y = dvp.return_shape(1)
     np.testing.assert_array_equal(x, np.array([1.0, 3.0, 5.0]))
     np.testing.assert_array_equal(y, np.array([2.0, 4.0, 6.0]))
+
+
+def test_dvpxml_return_shape_reads_nested_coordinates(tmp_path: Path) -> None:
+    xml_path = tmp_path / "nested.xml"
+    xml_path.write_text(
+        "<ImageData><ShapeCount>1</ShapeCount><Shape_1>"
+        "<PointCount>2</PointCount>"
+        "<Points><X_1>1</X_1><Y_1>2</Y_1></Points>"
+        "<X_2>3</X_2><Y_2>4</Y_2>"
+        "</Shape_1></ImageData>",
+        encoding="utf-8",
+    )
+
+    x, y = DVPXML(str(xml_path)).return_shape(1)
+
+    np.testing.assert_array_equal(x, np.array([1.0, 3.0]))
+    np.testing.assert_array_equal(y, np.array([2.0, 4.0]))
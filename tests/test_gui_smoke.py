@@ -23,3 +23,34 @@ def test_main_window_has_expected_pages(qapp) -> None:
     assert window.img_stack.count() >= 2
 
     window.close()
+
+
+def test_label_checkboxes_keep_surviving_rows(qapp) -> None:
+    from cellpick.app.ui_main import ActionPage
+
+    page = ActionPage()
+    page.update_label_checkboxes({"b": (0, 255, 0), "a": (255, 0, 0), "c": (0, 0, 9)})
+    rows = dict(page._label_rows)
+    page.label_checkboxes["a"].setChecked(False)
+
+    page.update_label_checkboxes({"c": (0, 0, 255), "a": (255, 0, 0), "d": (9, 9, 9)})
+    qapp.processEvents()
+
+    assert list(page.label_checkboxes) == ["a", "c", "d"]
+    for label in ("a", "c"):
+        assert page._label_rows[label] is rows[label]
+    assert page._label_rows["d"][0] is not rows["b"][0]
+
+    layout = page.label_checkboxes_layout
+    order = [layout.itemAt(i).widget() for i in range(layout.count())]
+    assert order[:3] == [page._label_rows[label][0] for label in ("a", "c", "d")]
+    assert rows["b"][0] not in order
+
+    assert page.get_selected_labels() == ["c", "d"]
+    assert page._label_rows["a"][2].color == (255, 0, 0)
+    assert page._label_rows["c"][2].color == (0, 0, 255)
+    assert page._label_rows["d"][2].color == (9, 9, 9)
+
+    page.update_label_checkboxes(None)
+    assert page.label_checkboxes == {} and page._label_rows == {}
+    page.close()
@@ -0,0 +1,73 @@
+"""Phase 1 tests for loading cell labels from CSV files."""
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from cellpick.app.spatialdata_io import (
+    SpatialDataLoader,
+    _coerce_int_ids,
+    _dense_labels,
+)
+
+
+def test_coerce_int_ids_matches_row_fallback_rules() -> None:
+    ids, valid = _coerce_int_ids(
+        pd.Series([3, 4.0, 2.5, " 12 ", "-4", "cell", None], dtype=object)
+    )
+
+    assert valid.tolist() == [True, True, False, True, False, False, False]
+    assert ids[valid].tolist() == [3, 4, 12]
+
+
+def test_coerce_int_ids_keeps_ids_above_2_53_exact() -> None:
+    big = 2**53 + 1
+
+    for values in (
+        pd.Series([str(big), f" {big + 2} ", "cell"]),
+        pd.Series([big, big + 2, "cell"], dtype=object),
+    ):
+        ids, valid = _coerce_int_ids(values)
+
+        assert valid.tolist() == [True, True, False]
+        assert ids[valid].tolist() == [big, big + 2]
+
+
+def test_coerce_int_ids_rejects_floats_outside_int64() -> None:
+    for values in (pd.Series([1e20, 3.0]), pd.Series([1e20, 3.0], dtype=object)):
+        ids, valid = _coerce_int_ids(values)
+
+        assert valid.tolist() == [False, True]
+        assert ids[valid].tolist() == [3]
+
+
+def test_load_labels_from_csv_converts_one_based_ids(tmp_path: Path) -> None:
+    csv_path = tmp_path / "labels.csv"
+    csv_path.write_text("cell_id,cluster\n1,A\n2,B\n3,\n")
+
+    labels = SpatialDataLoader.load_labels_from_csv(str(csv_path))
+
+    assert labels == {0: "A", 1: "B", 2: ""}
+
+
+def test_load_labels_from_csv_keeps_large_ids_exact(tmp_path: Path) -> None:
+    csv_path = tmp_path / "labels.csv"
+    csv_path.write_text(
+        "cell_id,cluster\n9007199254740993,A\nfoo,C\n9007199254740995,B\n"
+    )
+
+    labels = SpatialDataLoader.load_labels_from_csv(str(csv_path))
+
+    assert labels == {9007199254740993: "A", 1: "C", 9007199254740995: "B"}
+
+
+def test_dense_labels_keeps_last_duplicate_and_rejects_sparse_ids() -> None:
+    labels = pd.Series(["A", "B", "C"], dtype=object)
+
+    dense = _dense_labels(np.array([1, 3, 1]), labels)
+
+    assert dense.tolist() == [None, "C", None, "B"]
+    assert _dense_labels(np.array([1, 30, 2]), labels) is None
+    assert _dense_labels(np.array([-1, 0, 2]), labels) is None
+    assert _dense_labels(np.array([], dtype=np.int64), labels[:0]).size == 0
@@ -0,0 +1,137 @@
+"""Phase 1 tests for rasterizing polygons into label masks."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from skimage.draw import polygon as draw_polygon
+
+from cellpick.app import spatialdata_io
+from cellpick.app.spatialdata_io import (
+    _FILL_BAND_MIN_ROWS,
+    _fill_polygons,
+    _fill_shared_polygons,
+    _polygon_pixels,
+)
+
+CASES = [
+    "random",
+    "concave",
+    "integer_vertices",
+    "border_clipped",
+    "overlapping",
+    "banded",
+]
+
+
+class _RowColPolygon:
+    def __init__(self, rowcol: np.ndarray) -> None:
+        self.rowcol = rowcol
+
+    def get_rowcol(self) -> np.ndarray:
+        return self.rowcol
+
+
+def _star(rng: np.random.Generator, center, radius, n: int = 12) -> np.ndarray:
+    angles = np.sort(rng.uniform(0.0, 2 * np.pi, n))
+    radii = rng.uniform(0.3, 1.0, n) * radius
+    return np.column_stack(
+        [center[0] + radii * np.sin(angles), center[1] + radii * np.cos(angles)]
+    )
+
+
+def _polygons(case: str):
+    rng = np.random.default_rng(0)
+    if case == "random":
+        return (64, 80), [_star(rng, (32, 40), 25, n=20)]
+    if case == "concave":
+        comb = [[5, 5], [5, 60], [40, 60], [40, 50], [15, 45], [40, 35], [15, 25]]
+        return (64, 80), [np.array(comb + [[40, 15], [40, 5]], dtype=float)]
+    if case == "integer_vertices":
+        l_shape = [[2, 2], [2, 20], [15, 20], [15, 10], [8, 10], [8, 2]]
+        triangle = [[20, 5], [35, 5], [20, 30]]
+        return (64, 80), [np.array(l_shape, float), np.array(triangle, float)]
+    if case == "border_clipped":
+        return (40, 60), [
+            np.array([[-5.5, -3.2], [-5.0, 40.7], [12.3, 70.1], [30.6, -8.4]]),
+            np.array([[20.0, 50.0], [45.5, 50.0], [45.5, 65.0], [20.0, 65.0]]),
+        ]
+    if case == "overlapping":
+        return (64, 80), [
+            _star(rng, (30 + 3 * k, 35 + 4 * k), 20, n=15) for k in range(4)
+        ]
+    if case == "banded":
+        height = 3 * _FILL_BAND_MIN_ROWS
+        centers = [(60, 30), (_FILL_BAND_MIN_ROWS, 32), (2 * _FILL_BAND_MIN_ROWS, 30)]
+        polygons = [_star(rng, c, 120, n=30) for c in centers]
+        polygons.append(np.array([[0.0, 10.0], [height - 1.0, 20.0], [40.0, 50.0]]))
+        return (height, 64), polygons
+    raise ValueError(case)
+
+
+def _reference_mask(shape, polygons, first_value: int = 1) -> np.ndarray:
+    mask = np.zeros(shape, dtype=np.uint32)
+    for k, poly in enumerate(polygons):
+        rr, cc = draw_polygon(poly[:, 0], poly[:, 1], shape=shape)
+        mask[rr, cc] = first_value + k
+    return mask
+
+
+def _check_rasterization(case: str, monkeypatch) -> None:
+    shape, polygons = _polygons(case)
+    # Both paths split work by the core count, so fake enough cores to split
+    monkeypatch.setattr(spatialdata_io.os, "cpu_count", lambda: 4)
+
+    mask = np.zeros(shape, dtype=np.uint32)
+    _fill_polygons(mask, polygons)
+    np.testing.assert_array_equal(mask, _reference_mask(shape, polygons))
+
+    for poly, flat in zip(polygons, _polygon_pixels(polygons, shape)):
+        rr, cc = draw_polygon(poly[:, 0], poly[:, 1], shape=shape)
+        np.testing.assert_array_equal(np.sort(flat), np.sort(rr * shape[1] + cc))
+
+    # Every other polygon is cached and reused by the second mask
+    wrapped = [_RowColPolygon(poly) for poly in polygons]
+    shared_ids = {id(poly) for poly in wrapped[::2]}
+    raster_cache = {}
+    for first_value in (1, 7):
+        mask = np.zeros(shape, dtype=np.uint32)
+        _fill_shared_polygons(mask, wrapped, first_value, raster_cache, shared_ids)
+        expected = _reference_mask(shape, polygons, first_value)
+        np.testing.assert_array_equal(mask, expected)
+    assert set(raster_cache) == shared_ids
+
+
+@pytest.mark.skipif(not spatialdata_io.NUMBA_AVAILABLE, reason="numba is not installed")
+@pytest.mark.parametrize("case", CASES)
+def test_numba_rasterization_matches_skimage(case: str, monkeypatch) -> None:
+    _check_rasterization(case, monkeypatch)
+
+
+@pytest.mark.skipif(not spatialdata_io.NUMBA_AVAILABLE, reason="numba is not installed")
+def test_numba_fill_splits_tall_masks_into_row_bands(monkeypatch) -> None:
+    shape, polygons = _polygons("banded")
+    monkeypatch.setattr(spatialdata_io.os, "cpu_count", lambda: 4)
+    bands = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+        def submit(self, fn, *args, **kwargs):
+            bands.append((int(args[-2]), int(args[-1])))
+            return super().submit(fn, *args, **kwargs)
+
+    monkeypatch.setattr(spatialdata_io, "ThreadPoolExecutor", RecordingExecutor)
+
+    mask = np.zeros(shape, dtype=np.uint32)
+    _fill_polygons(mask, polygons)
+
+    # One band per _FILL_BAND_MIN_ROWS rows, tiling the mask top to bottom
+    assert len(bands) == 3
+    assert [start for start, _ in bands] == [0] + [stop for _, stop in bands[:-1]]
+    assert bands[-1][1] == shape[0]
+    np.testing.assert_array_equal(mask, _reference_mask(shape, polygons))
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_fallback_rasterization_matches_skimage(case: str, monkeypatch) -> None:
+    monkeypatch.setattr(spatialdata_io, "NUMBA_AVAILABLE", False)
+    _check_rasterization(case, monkeypatch)
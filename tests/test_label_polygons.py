@@ -0,0 +1,49 @@
+"""Phase 1 tests for label-image polygon extraction."""
+
+import numpy as np
+import pytest
+from shapely.geometry import Polygon
+
+from cellpick.app.spatialdata_io import extract_polygons_from_label_image
+
+
+def _two_cell_labels() -> np.ndarray:
+    labels = np.zeros((40, 60), dtype=np.int32)
+    labels[5:15, 5:15] = 1
+    labels[20:35, 30:50] = 2
+    labels[1, 1] = 3  # single pixel, below min_area
+    return labels
+
+
+def test_extract_polygons_one_per_label() -> None:
+    polygons = extract_polygons_from_label_image(_two_cell_labels(), min_area=10)
+
+    assert [(label, mask_id) for _, label, mask_id in polygons] == [
+        ("Cell_1", 1),
+        ("Cell_2", 2),
+    ]
+    for points, _, _ in polygons:
+        assert len(points) >= 3
+
+
+def test_extract_polygons_stay_within_label_bbox() -> None:
+    polygons = extract_polygons_from_label_image(_two_cell_labels(), min_area=10)
+
+    points, _, _ = polygons[1]
+    xs = [pt.x() for pt in points]
+    ys = [pt.y() for pt in points]
+    assert 29.0 <= min(xs) and max(xs) <= 50.0
+    assert 19.0 <= min(ys) and max(ys) <= 35.0
+
+
+def test_extract_polygons_fragmented_label_keeps_main_body() -> None:
+    labels = np.zeros((80, 80), dtype=np.int32)
+    yy, xx = np.mgrid[:80, :80]
+    labels[(yy - 45) ** 2 + (xx - 40) ** 2 < 30**2] = 1
+    labels[3:5, 30:34] = 1  # stray fragment above the main body
+
+    [(points, _, _)] = extract_polygons_from_label_image(labels, min_area=10)
+    polygon = Polygon([(pt.x(), pt.y()) for pt in points])
+
+    assert polygon.area == pytest.approx(np.pi * 30**2, rel=0.05)
+    assert polygon.bounds[1] >= 14.0
@@ -0,0 +1,146 @@
+"""Phase 1 tests for reading SpatialData stores."""
+
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sd = pytest.importorskip("spatialdata")
+
+import anndata as ad  # noqa: E402
+from PySide6.QtCore import QPointF  # noqa: E402
+from scipy.ndimage import center_of_mass  # noqa: E402
+from spatialdata.models import Image2DModel, Labels2DModel, TableModel  # noqa: E402
+
+from cellpick.app.spatialdata_io import SpatialDataLoader  # noqa: E402
+
+
+def _write_store(
+    path: Path, cell_ids: List[int], nucleus_ids: Optional[List[int]] = None
+) -> str:
+    labels = np.zeros((20, 20), dtype=np.int32)
+    labels[2:6, 2:6] = 1
+    obs = pd.DataFrame(
+        {
+            "region": pd.Categorical(["cells"] * len(cell_ids)),
+            "cell_id": cell_ids,
+            "cluster": [f"C{i}" for i in range(len(cell_ids))],
+        }
+    )
+    if nucleus_ids is not None:
+        obs["nucleus_id"] = nucleus_ids
+    table = TableModel.parse(
+        ad.AnnData(obs=obs), region="cells", region_key="region", instance_key="cell_id"
+    )
+    sdata = sd.SpatialData(
+        images={
+            "img": Image2DModel.parse(
+                np.zeros((1, 20, 20), np.uint8), dims=("c", "y", "x")
+            )
+        },
+        labels={"cells": Labels2DModel.parse(labels, dims=("y", "x"))},
+        tables={"table": table},
+    )
+    store = str(path / "store.zarr")
+    sdata.write(store)
+    return store
+
+
+def test_get_cell_labels_array_dense_ids(tmp_path: Path) -> None:
+    loader = SpatialDataLoader(_write_store(tmp_path, [1, 3]))
+
+    labels = loader.get_cell_labels_array("cluster")
+
+    assert labels.tolist() == [None, "C0", None, "C1"]
+    assert loader.get_cell_labels("cluster") == {1: "C0", 3: "C1"}
+    assert loader.get_cell_label_mapping("cluster").tolist() == labels.tolist()
+
+
+def test_get_cell_labels_array_sparse_ids_returns_none(tmp_path: Path) -> None:
+    loader = SpatialDataLoader(_write_store(tmp_path, [1, 50]))
+
+    assert loader.get_cell_labels_array("cluster") is None
+    assert loader.get_cell_labels("cluster") == {1: "C0", 50: "C1"}
+    assert loader.get_cell_label_mapping("cluster") == {1: "C0", 50: "C1"}
+    assert loader.get_cell_label_mapping("missing") is None
+
+
+def test_get_cell_labels_array_duplicate_ids_keep_last_row(tmp_path: Path) -> None:
+    loader = SpatialDataLoader(_write_store(tmp_path, [1, 2, 3], [1, 2, 1]))
+
+    labels = loader.get_cell_labels_array("cluster", instance_column="nucleus_id")
+    by_id = loader.get_cell_labels("cluster", instance_column="nucleus_id")
+
+    assert labels.tolist() == [None, "C2", "C1"]
+    assert by_id == {1: "C2", 2: "C1"}
+
+
+def test_selection_is_forwarded_to_read_zarr(tmp_path: Path) -> None:
+    loader = SpatialDataLoader(_write_store(tmp_path, [1]), selection=("labels",))
+
+    # Listing names reads only the zarr metadata, not the SpatialData object
+    assert loader.get_available_labels() == ["cells"]
+    assert loader.get_available_images() == []
+    assert loader._sdata is None
+
+    assert list(loader.sdata.labels) == ["cells"]
+    assert len(loader.sdata.images) == 0
+    assert len(loader.sdata.tables) == 0
+
+
+def _square(cx: float, cy: float) -> List[QPointF]:
+    return [
+        QPointF(cx + dx, cy + dy) for dx, dy in [(-2, -2), (2, -2), (2, 2), (-2, 2)]
+    ]
+
+
+def _brute_force_matches(loader: SpatialDataLoader, polygons) -> List[int]:
+    # The linear scan load_cellpick_selected_cells used before the cKDTree
+    matches = []
+    for mask, r_off, c_off in loader._annotation_windows(
+        "cellpick_selected_cells"
+    ).values():
+        cy, cx = center_of_mass(mask)
+        sel_x, sel_y = float(cx) + c_off, float(cy) + r_off
+        best_idx, best_dist = None, float("inf")
+        for idx, (points, _) in enumerate(polygons):
+            if len(points) > 0:
+                px = sum(pt.x() for pt in points) / len(points)
+                py = sum(pt.y() for pt in points) / len(points)
+                dist = ((px - sel_x) ** 2 + (py - sel_y) ** 2) ** 0.5
+                if dist < best_dist:
+                    best_idx, best_dist = idx, dist
+        if best_idx is not None and best_dist < 50:
+            matches.append(best_idx)
+    return matches
+
+
+def test_load_cellpick_selected_cells_matches_linear_scan(tmp_path: Path) -> None:
+    selected = np.zeros((200, 200), dtype=np.int32)
+    cells = [(10, 10), (40, 10), (120, 20), (170, 110)]
+    for label_id, (x, y) in enumerate(cells, 1):
+        selected[y - 1 : y + 2, x - 1 : x + 2] = label_id
+    store = str(tmp_path / "store.zarr")
+    sd.SpatialData(
+        labels={
+            "cellpick_selected_cells": Labels2DModel.parse(selected, dims=("y", "x"))
+        }
+    ).write(store)
+    loader = SpatialDataLoader(store)
+
+    # The second cell ties between polygons 0 and 24, which the filler row
+    # puts in different tree leaves. The third cell is exactly 50 px from
+    # polygon 22 and the fourth 60 px from polygon 23, so neither matches.
+    centers = [(40, 4), (10, 10)] + [(x, 190) for x in range(0, 200, 10)]
+    centers += [(120, 70), (170, 170), (40, 16)]
+    polygons = [(_square(x, y), "cell") for x, y in centers]
+
+    expected = _brute_force_matches(loader, polygons + [([], "empty")])
+    assert expected == [1, 0]
+    assert loader.load_cellpick_selected_cells(polygons + [([], "empty")]) == expected
+    assert (
+        loader.load_cellpick_selected_cells(polygons, np.array(centers, float))
+        == expected
+    )
@@ -0,0 +1,50 @@
+"""Phase 1 tests for the application state manager."""
+
+import numpy as np
+import pytest
+
+from cellpick.app.core.polygon import Polygon
+from cellpick.app.core.state import AppStateManager
+
+
+def _state(original_ids, monkeypatch) -> AppStateManager:
+    state = AppStateManager()
+    state.shapes = [Polygon(points=[], original_id=i) for i in original_ids]
+    # Label colors come from matplotlib, which only the GUI needs
+    monkeypatch.setattr(state, "generate_label_colors", lambda: None)
+    return state
+
+
+def _as_dict(labels) -> dict:
+    return {i: label for i, label in enumerate(labels) if label is not None}
+
+
+@pytest.mark.parametrize("as_array", [False, True])
+def test_load_cell_labels_dense_by_original_id(as_array: bool, monkeypatch) -> None:
+    labels = ["a", None, "b", "c"]
+    dense = np.array(labels, dtype=object) if as_array else labels
+    # IDs 1 (no label), 40 (past the end) and -1 (negative) get no label
+    original_ids = [2, 1, 0, 40, 3, -1]
+    state = _state(original_ids, monkeypatch)
+
+    state.load_cell_labels(dense)
+
+    assert state.cell_labels == {0: "b", 2: "a", 4: "c"}
+    keyed = _state(original_ids, monkeypatch)
+    keyed.load_cell_labels(_as_dict(labels))
+    assert keyed.cell_labels == state.cell_labels
+
+
+@pytest.mark.parametrize("as_array", [False, True])
+def test_load_cell_labels_dense_by_shape_index(as_array: bool, monkeypatch) -> None:
+    labels = ["a", None, "b", None, "c"]
+    dense = np.array(labels, dtype=object) if as_array else labels
+    # Three shapes, so index 4 is past the last shape, as with a dict
+    state = _state([None, None, None], monkeypatch)
+
+    state.load_cell_labels(dense)
+
+    assert state.cell_labels == {0: "a", 2: "b", 4: "c"}
+    keyed = _state([None, None, None], monkeypatch)
+    keyed.load_cell_labels(_as_dict(labels))
+    assert keyed.cell_labels == state.cell_labels
@@ -0,0 +1,44 @@
+"""Phase 2 tests for reusable UI components."""
+
+
+def _mouse_event(kind, x: int):
+    from PySide6.QtCore import QPointF, Qt
+    from PySide6.QtGui import QMouseEvent
+
+    pos = QPointF(x, 10)
+    return QMouseEvent(kind, pos, pos, pos, Qt.LeftButton, Qt.LeftButton, Qt.NoModifier)
+
+
+def test_range_slider_coalesces_drag_emissions(qapp) -> None:
+    from PySide6.QtCore import QEvent
+    from PySide6.QtWidgets import QApplication
+
+    from cellpick.app.ui_components import RangeSlider
+
+    slider = RangeSlider()
+    slider.resize(216, 20)
+    emitted = []
+    slider.rangeChanged.connect(lambda lo, hi: emitted.append((lo, hi)))
+
+    # Drag the low handle, then the high handle, without returning to the loop
+    for kind, x in [
+        (QEvent.MouseButtonPress, 8),
+        (QEvent.MouseMove, 58),
+        (QEvent.MouseMove, 108),
+        (QEvent.MouseButtonRelease, 108),
+        (QEvent.MouseButtonPress, 208),
+        (QEvent.MouseMove, 158),
+        (QEvent.MouseMove, 183),
+        (QEvent.MouseButtonRelease, 183),
+    ]:
+        QApplication.sendEvent(slider, _mouse_event(kind, x))
+    assert emitted == []
+
+    qapp.processEvents()
+    assert emitted == [(slider.min_val, slider.max_val)]
+    assert emitted[0] == (0.5, 0.875)
+
+    qapp.processEvents()
+    assert len(emitted) == 1
+
+    slider.deleteLater()